@@ -0,0 +1,256 @@
+import argparse
+import contextlib
+import os
+import re
+import time
+import tracemalloc
+from typing import Callable, Dict
+
+import day_2
+import day_3
+import day_6
+import day_7
+import day_10
+import generators
+from grid import Grid
+from solution_base import AocSolution, InputSource, ProgressStatus, bold
+
+# Micro-benchmarks of shared infrastructure and solver building blocks, run with: python benchmarks.py [name ...]
+BENCHMARKS: Dict[str, Callable[[argparse.Namespace], None]] = {}
+
+
+def benchmark(name: str) -> Callable:
+    """Register a micro-benchmark under the given name"""
+
+    def decorator(func: Callable[[argparse.Namespace], None]) -> Callable[[argparse.Namespace], None]:
+        BENCHMARKS[name] = func
+        return func
+
+    return decorator
+
+
+def time_call(func: Callable[[], object], repeat: int = 5) -> float:
+    """Best wall-clock time of several calls in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@benchmark("progress")
+def bench_progress(args: argparse.Namespace) -> None:
+    """Per-update overhead of ProgressStatus compared to an empty loop"""
+    n = args.size or 1_000_000
+
+    def empty_loop():
+        for _ in range(n):
+            pass
+
+    def run_progress(verbose: bool, refresh_interval: float = 0.1):
+        def run():
+            progress = ProgressStatus(n, "Benchmark", verbose=verbose, refresh_interval=refresh_interval)
+            for _ in range(n):
+                progress.update()
+
+        return run
+
+    variants = {
+        "empty loop": empty_loop,
+        "verbose=False": run_progress(False),
+        "verbose=True": run_progress(True),
+        "verbose=True, redraw every update": run_progress(True, 0),
+    }
+
+    baseline = time_call(empty_loop, args.repeat)
+    print(bold(f"ProgressStatus.update overhead ({n} updates, best of {args.repeat})"))
+    with open(os.devnull, "w") as devnull:
+        for name, func in variants.items():
+            with contextlib.redirect_stdout(devnull):
+                elapsed = time_call(func, args.repeat)
+            print(f"  {name:<36} {elapsed * 1000:9.2f}ms  {(elapsed - baseline) / n * 1e9:8.1f}ns/update")
+
+
+def _legacy_guard_path(rows: list[list[str]]) -> int:
+    """Day 6 part 1 as it was before the Grid: list of lists, (x, y) tuples and explicit bounds checks"""
+    directions = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+    y = next(y for y, row in enumerate(rows) if '^' in row)
+    x, direction = rows[y].index('^'), 0
+    visited = {(x, y)}
+    while True:
+        dx, dy = directions[direction]
+        nx, ny = x + dx, y + dy
+        if nx < 0 or len(rows[0]) <= nx or ny < 0 or len(rows) <= ny:
+            return len(visited)
+        if rows[ny][nx] == '#':
+            direction = (direction + 1) % 4
+        else:
+            x, y = nx, ny
+            visited.add((x, y))
+
+
+def _legacy_trail_edges(rows: list[list[str]]) -> int:
+    """Day 10 graph edges as they were before the Grid: (x, y) tuples with bounds checks on every neighbour"""
+    edges = {}
+    for y, row in enumerate(rows):
+        for x, height in enumerate(row):
+            height = int(height)
+            if x != 0 and int(rows[y][x - 1]) - height in (1, -1):
+                edges.setdefault((x, y), []).append((x - 1, y))
+            if y != 0 and int(rows[y - 1][x]) - height in (1, -1):
+                edges.setdefault((x, y), []).append((x, y - 1))
+    return len(edges)
+
+
+@benchmark("grid")
+def bench_grid(args: argparse.Namespace) -> None:
+    """The shared Grid against the per-day list-of-lists code it replaced, on generated inputs"""
+    size = args.size or 1024
+
+    def source(day: int) -> InputSource:
+        return InputSource(day, 1, False, path=generators.generate(day, size), use_cache=False)
+
+    guard_rows = source(6).read_char_grid()
+    guard_grid = Grid.from_input(source(6))
+    height_rows = source(10).read_char_grid()
+
+    cases = {
+        "parse (list of lists)": lambda: source(6).read_char_grid(),
+        "parse (Grid)": lambda: Grid.from_input(source(6)),
+        "count obstacles (list of lists)": lambda: sum(row.count('#') for row in guard_rows),
+        "count obstacles (Grid)": lambda: guard_grid.count(b'#'),
+        "day 6 guard path (list of lists)": lambda: _legacy_guard_path(guard_rows),
+        "day 6 guard path (Grid)": lambda: len({index for index, _ in day_6.find_path(
+            guard_grid, day_6.find_start_position(guard_grid))}),
+        "day 10 graph (list of lists)": lambda: _legacy_trail_edges(height_rows),
+        "day 10 graph incl. parse (Grid)": lambda: day_10.build_graph(source(10)),
+    }
+
+    print(bold(f"Grid against list of lists ({size}x{size} generated inputs, best of {args.repeat})"))
+    for name, func in cases.items():
+        print(f"  {name:<36} {time_call(func, args.repeat) * 1000:9.2f}ms")
+
+
+def _legacy_can_be_dampened(report: list[int]) -> bool:
+    """Day 2 dampener as it was before the single pass: every variation with one level removed, copied and checked"""
+    return any(day_2.is_safe(report[:i] + report[i + 1:]) for i in range(len(report)))
+
+
+@benchmark("day2")
+def bench_day2(args: argparse.Namespace) -> None:
+    """Report throughput of the Day 2 dampener on a generated input"""
+    size = args.size or 10 ** 6
+    input_path = generators.generate(2, size)
+    reports = list(InputSource(2, 2, False, path=input_path, use_cache=False).iter_int_rows(' '))
+    solution = day_2.Day2()
+
+    cases = {
+        "variations (removed)": lambda: sum(day_2.is_safe(report) or _legacy_can_be_dampened(report)
+                                            for report in reports),
+        "single pass": lambda: sum(map(day_2.is_dampened_safe, reports)),
+        "single pass, k=2": lambda: sum(day_2.can_be_dampened(report, 2) for report in reports),
+        "part 2 incl. parsing": lambda: solution.solve(2, input_path=input_path),
+    }
+    if day_2.np is not None:
+        lines = InputSource(2, 2, False, path=input_path, use_cache=False).read_lines()
+        packed = [day_2.pack_reports(batch) for batch in day_2.batches(lines)]
+        cases.update({
+            "numpy pack": lambda: [day_2.pack_reports(batch) for batch in day_2.batches(lines)],
+            "numpy safe": lambda: sum(day_2.count_safe_batch(*batch) for batch in packed),
+            "numpy dampened": lambda: sum(day_2.count_dampened_safe_batch(*batch) for batch in packed),
+        })
+
+    print(bold(f"Day 2 dampener ({size} generated reports, best of {args.repeat})"))
+    for name, func in cases.items():
+        elapsed = time_call(func, args.repeat)
+        print(f"  {name:<36} {elapsed * 1000:9.2f}ms  {size / elapsed / 1e6:6.2f}M reports/s")
+
+
+def _legacy_conditional_sum_of_mul(s: str) -> int:
+    """Day 3 part 2 as it was before the scanner: the whole memory in one string, sliced between do() and don't()"""
+    def sum_of_mul(part: str) -> int:
+        return sum(int(x) * int(y) for x, y in re.findall(r"mul\((\d{1,3}),(\d{1,3})\)", part))
+
+    res = 0
+    do_index = 0
+    dont_index = s.find("don't()")
+    while -1 < dont_index:
+        res += sum_of_mul(s[do_index:dont_index])
+        do_index = s.find("do()", dont_index)
+        if do_index == -1:
+            break
+        dont_index = s.find("don't()", do_index)
+    if -1 < do_index:
+        res += sum_of_mul(s[do_index:])
+    return res
+
+
+@benchmark("day3")
+def bench_day3(args: argparse.Namespace) -> None:
+    """Time and peak memory of Day 3 part 2 on generated corrupted memory, read at once or streamed in chunks"""
+    size = args.size or 10 ** 7
+    source = InputSource(3, 2, False, path=generators.generate(3, size), use_cache=False)
+
+    cases = {
+        "read at once, sliced (removed)": lambda: _legacy_conditional_sum_of_mul(source.read_raw()),
+        "streamed, 64 KiB chunks": lambda: day_3.sum_of_mul(source.iter_chunks(1 << 16), conditional=True),
+        "streamed, 1 MiB chunks": lambda: day_3.sum_of_mul(source.iter_chunks(), conditional=True),
+    }
+
+    print(bold(f"Day 3 scanner ({size} generated characters, best of {args.repeat})"))
+    for name, func in cases.items():
+        elapsed = time_call(func, args.repeat)
+        tracemalloc.start()
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"  {name:<36} {elapsed * 1000:9.2f}ms  {size / elapsed / 1e6:7.1f}MB/s  peak {peak / 2 ** 20:7.1f}MiB")
+
+
+def print_worker_scaling(solution: AocSolution, part: int, input_path: str, repeat: int) -> None:
+    """Time a part with 1, 2, 4, ... worker processes up to the CPU count"""
+    solution.progress_verbose = False
+    serial = None
+    workers = 1
+    while workers <= max(os.cpu_count() or 1, 1):
+        solution.workers = workers
+        elapsed = time_call(lambda: solution.solve(part, input_path=input_path), repeat)
+        serial = serial or elapsed
+        print(f"  {workers:>3} workers {elapsed * 1000:9.2f}ms  speedup {serial / elapsed:5.2f}x")
+        workers *= 2
+
+
+@benchmark("day6-workers")
+def bench_day6_workers(args: argparse.Namespace) -> None:
+    """Day 6 part 2 on a generated grid with a growing number of worker processes"""
+    size = args.size or 1024
+    print(bold(f"Day 6 part 2 by worker processes ({size}x{size} generated grid, best of {args.repeat}, "
+               f"{os.cpu_count()} CPUs)"))
+    print_worker_scaling(day_6.Day6(), 2, generators.generate(6, size), args.repeat)
+
+
+@benchmark("day7-workers")
+def bench_day7_workers(args: argparse.Namespace) -> None:
+    """Day 7 part 2 on generated equations with a growing number of worker processes"""
+    size = args.size or 10 ** 5
+    print(bold(f"Day 7 part 2 by worker processes ({size} generated equations, best of {args.repeat}, "
+               f"{os.cpu_count()} CPUs)"))
+    print_worker_scaling(day_7.Day7(), 2, generators.generate(7, size), args.repeat)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run micro-benchmarks")
+    parser.add_argument("names", nargs="*", choices=[[], *BENCHMARKS], metavar="name",
+                        help=f"Benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument("--size", type=int, help="Problem size, each benchmark has its own default")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of repetitions, the best one is reported")
+    args = parser.parse_args()
+
+    for name in args.names or BENCHMARKS:
+        BENCHMARKS[name](args)
+        print()
+
+
+if __name__ == "__main__":
+    main()
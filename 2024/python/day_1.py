@@ -136,7 +136,7 @@ from solution_base import AocSolution, InputSource, solution
 def extract_lists(input_data: InputSource) -> tuple[list[int], list[int]]:
     left_list, right_list = list(), list()
 
-    for left, right, *_ in input_data.read_lists_of_integers('   '):
+    for left, right, *_ in input_data.iter_int_rows('   '):
         left_list.append(left)
         right_list.append(right)
 
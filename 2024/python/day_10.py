@@ -1,5 +1,6 @@
 from collections import defaultdict, deque
 
+from grid import Grid
 from solution_base import AocSolution, solution, InputSource
 
 # -------------------
@@ -170,13 +171,13 @@ from solution_base import AocSolution, solution, InputSource
 # your topographic map. What is the sum of the ratings of all trailheads?
 
 Weight = int
-Coord = tuple[int, int]
+Cell = int  # Index of a cell in the Grid
 
 
 class Graph:
-    heights: dict[Coord, Weight]
-    edges: dict[Coord, list[Coord]]
-    start_nodes: list[Coord]
+    heights: dict[Cell, Weight]
+    edges: dict[Cell, list[Cell]]
+    start_nodes: list[Cell]
 
     def __init__(self):
         self.heights = defaultdict(int)
@@ -184,38 +185,27 @@ class Graph:
         self.edges = defaultdict(list)
 
 
-def add_edges(graph: Graph, height_map: list[list[int]], x: int, y: int) -> None:
-    coord = (x, y)
-    height = height_map[y][x]
-    if x != 0:
-        height_left = height_map[y][x - 1]
-        coord_left = (x - 1, y)
-        if height_left == height + 1:
-            graph.edges[coord].append(coord_left)
-        elif height_left == height - 1:
-            graph.edges[coord_left].append(coord)
-    if y != 0:
-        height_up = height_map[y - 1][x]
-        coord_up = (x, y - 1)
-        if height_up == height + 1:
-            graph.edges[coord].append(coord_up)
-        elif height_up == height - 1:
-            graph.edges[coord_up].append(coord)
-
-
-def build_graph(input_data: InputSource) -> Graph:
+def add_edges(graph: Graph, height_map: Grid, cell: Cell) -> None:
+    # The border of the grid never differs by one from a height, so the first row and column need no checks
+    height = height_map[cell]
+    for neighbour in (cell + height_map.left, cell + height_map.up):
+        neighbour_height = height_map[neighbour]
+        if neighbour_height == height + 1:
+            graph.edges[cell].append(neighbour)
+        elif neighbour_height == height - 1:
+            graph.edges[neighbour].append(cell)
+
+
+def build_graph(height_map: Grid) -> Graph:
     graph = Graph()
-    height_map = input_data.read_digit_grid()
-    for y, row in enumerate(height_map):
-        for x, height in enumerate(row):
-            graph.heights[(x, y)] = height
-            if height == 0:
-                graph.start_nodes.append((x, y))
-            add_edges(graph, height_map, x, y)
+    for cell in height_map.indices():
+        graph.heights[cell] = height_map[cell] - ord('0')
+        add_edges(graph, height_map, cell)
+    graph.start_nodes = list(height_map.find_all(b'0'))
     return graph
 
 
-def find_trailends(graph: Graph, start: Coord) -> list[Coord]:
+def find_trailends(graph: Graph, start: Cell) -> list[Cell]:
     ends = []
     q = deque([start])
     while len(q) > 0:
@@ -241,17 +231,20 @@ class Day10(AocSolution):
     def question_part2(self) -> str:
         return "What is the sum of the ratings of all trailheads?"
 
+    def parse(self, input_data: InputSource) -> Grid:
+        return Grid.from_input(input_data)
+
     @solution(538)
-    def solve_part1(self, input_data: InputSource) -> int:
-        graph = build_graph(input_data)
+    def solve_part1(self, height_map: Grid) -> int:
+        graph = build_graph(height_map)
         count = 0
         for start in graph.start_nodes:
             count += len(set(find_trailends(graph, start)))
         return count
 
     @solution(1110)
-    def solve_part2(self, input_data: InputSource) -> int:
-        graph = build_graph(input_data)
+    def solve_part2(self, height_map: Grid) -> int:
+        graph = build_graph(height_map)
         count = 0
         for start in graph.start_nodes:
             count += len(find_trailends(graph, start))
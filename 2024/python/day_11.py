@@ -1,3 +1,7 @@
+from bisect import bisect_right
+from collections import defaultdict
+from functools import cache
+
 from solution_base import AocSolution, solution, InputSource
 
 # -------------------
@@ -88,46 +92,51 @@ from solution_base import AocSolution, solution, InputSource
 
 # How many stones would you have after blinking a total of 75 times?
 
-Stone = tuple[int, str]
-
+Stones = dict[int, int]  # Engraved number -> number of stones with it
 
-def read_stones(input_data: InputSource) -> list[Stone]:
-    return [(int(stone), stone) for stone in input_data.read_raw().split(' ')]
+# Stones usually stay far below 10^64 (a number with an odd digit count grows by 4 digits at most before it
+# splits), larger ones extend the table in count_digits
+POWERS_OF_TEN = [10 ** exponent for exponent in range(64)]
 
 
-def evolve_stone(stone: Stone) -> list[Stone]:
-    num, char = stone
-    if num == 0:
-        return [(1, '1')]
-    if len(char) % 2 == 0:
-        middle = len(char) // 2
-        left, right_num = char[:middle], int(char[middle:])
-        return [(int(left), left), (right_num, str(right_num))]
-    new_num = num * 2024
-    return [(new_num, str(new_num))]
+def read_stones(input_data: InputSource) -> Stones:
+    stones = defaultdict(int)
+    for stone in input_data.read_raw().split():
+        stones[int(stone)] += 1
+    return stones
 
 
-def evolve_recursive(stone: Stone, cache: dict[tuple[Stone, int], int], steps: int) -> int:
-    """Recursively evolve a stone up to the given number of steps and cache the result."""
-    if steps == 0:
-        return 1  # Base case: 1 stone remains at step 0
+def count_digits(num: int) -> int:
+    while num >= POWERS_OF_TEN[-1]:
+        POWERS_OF_TEN.append(POWERS_OF_TEN[-1] * 10)
+    return bisect_right(POWERS_OF_TEN, num)
 
-    if (stone, steps) in cache:
-        return cache[(stone, steps)]
 
-    total_stones = 0
-    for evolved_stone in evolve_stone(stone):
-        total_stones += evolve_recursive(evolved_stone, cache, steps - 1)
-
-    cache[(stone, steps)] = total_stones
-    return total_stones
+@cache
+def evolve_stone(num: int) -> tuple[int, ...]:
+    """Stones replacing a stone after one blink, memoised as only a few thousand distinct numbers ever appear"""
+    if num == 0:
+        return (1,)
+    digits = count_digits(num)
+    if digits % 2 == 0:
+        return divmod(num, POWERS_OF_TEN[digits // 2])
+    return (num * 2024,)
+
+
+def blink(stones: Stones) -> Stones:
+    """All stones with the same number evolve alike, so each distinct number is evolved once per blink"""
+    new_stones = defaultdict(int)
+    for num, count in stones.items():
+        for new_num in evolve_stone(num):
+            new_stones[new_num] += count
+    return new_stones
 
 
-def blink(stones: list[Stone]) -> list[Stone]:
-    new_stones = []
-    for stone in stones:
-        new_stones.extend(evolve_stone(stone))
-    return new_stones
+def count_stones(stones: Stones, blinks: int) -> int:
+    """Number of stones after blinking; memory is bounded by the number of distinct numbers, not of stones"""
+    for _ in range(blinks):
+        stones = blink(stones)
+    return sum(stones.values())
 
 
 class Day11(AocSolution):
@@ -147,20 +156,12 @@ class Day11(AocSolution):
     @solution(217443)
     def solve_part1(self, input_data: InputSource) -> int:
         stones = read_stones(input_data)
-        for _ in range(25):
-            stones = blink(stones)
-        return len(stones)
+        return count_stones(stones, 25)
 
     @solution(257246536026785)
     def solve_part2(self, input_data: InputSource) -> int:
         stones = read_stones(input_data)
-        cache = {}
-
-        total_stones = 0
-        for i, stone in enumerate(stones):
-            total_stones += evolve_recursive(stone, cache, 75)
-
-        return total_stones
+        return count_stones(stones, 75)
 
 
 if __name__ == "__main__":
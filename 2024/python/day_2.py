@@ -1,5 +1,13 @@
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
 from solution_base import AocSolution, solution, InputSource
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, without it the reports are checked one by one
+    np = None
+
 
 # -------------------
 # Part 1: Description
@@ -109,30 +117,126 @@ def is_safe(report: list[int]) -> bool:
     return True
 
 
-def get_variations(report: list[int], gap_size: int) -> list[list[int]]:
-    """return all variations where the number of dampening_level adjacent items are missing.
-        for example: ([1, 2, 3], 1) -> [[2, 3], [1, 3], [1, 2]]
-        for example: ([1, 2, 3], 2) -> [[3], [1]]
+def can_be_dampened(report: list[int], removals: int = 1) -> bool:
     """
-    if gap_size < 0 or gap_size >= len(report):
-        raise ValueError("The gap size must be between 0 and the length of the report.")
-
-    variations = []
-    for i in range(len(report)):
-        if i + gap_size > len(report):
-            break
-        variations.append(report[:i] + report[i + gap_size:])
-    return variations
-
+    Whether the report is safe after removing at most `removals` levels, checked in a single pass for both
+    directions. rising[i] (falling[i]) is the fewest removals leaving a safe rising (falling) report up to level i
+    with level i kept. The kept level before i can be at most removals + 1 positions back, so every level
+    looks at removals + 1 predecessors: O(n * k) time instead of checking every variation of the report.
+    """
+    n = len(report)
+    if n - removals <= 1:
+        return True
 
-def can_be_dampened(report: list[int], level: int = 1) -> bool:
-    return any(is_safe(variations) for variations in get_variations(report, level))
+    rising = [0] * n
+    falling = [0] * n
+    hopeless = 0  # Consecutive levels that cannot be kept within the allowed removals
+    for i, level in enumerate(report):
+        fewest_rising = fewest_falling = i  # Remove every level before i
+        for j in range(max(0, i - removals - 1), i):
+            step = level - report[j]
+            if 0 < step < 4:
+                removed = rising[j] + i - j - 1
+                if removed < fewest_rising:
+                    fewest_rising = removed
+            elif -4 < step < 0:
+                removed = falling[j] + i - j - 1
+                if removed < fewest_falling:
+                    fewest_falling = removed
+        rising[i] = fewest_rising
+        falling[i] = fewest_falling
+
+        if fewest_rising > removals and fewest_falling > removals:
+            hopeless += 1
+            if hopeless > removals:
+                # No later level can follow any of these, and starting after them removes too many
+                return False
+        else:
+            hopeless = 0
+
+    # The levels after the last kept one are removed as well
+    return any(min(rising[i], falling[i]) + n - 1 - i <= removals for i in range(n - 1 - removals, n))
 
 
 def is_dampened_safe(report: list[int]) -> bool:
     return is_safe(report) or can_be_dampened(report)
 
 
+BATCH_SIZE = 1 << 16  # Reports per NumPy batch, bounds the memory of the intermediate arrays
+
+
+def pack_reports(lines: list[str]) -> tuple['np.ndarray', 'np.ndarray']:
+    """
+    Pack reports of single space separated levels into a (reports, longest) int32 array, padded with zeros
+    after the end of each report, and the vector of report lengths. All levels are parsed by one NumPy call
+    (any whitespace separates them) and scattered into their rows, there is no loop over the reports.
+    """
+    lengths = np.fromiter((line.count(' ') + 1 for line in lines), dtype=np.int64, count=len(lines))
+    values = np.fromstring('\n'.join(lines), dtype=np.int32, sep=' ')
+    rows = np.repeat(np.arange(len(lines)), lengths)
+    starts = np.cumsum(lengths) - lengths
+    columns = np.arange(len(values)) - np.repeat(starts, lengths)
+
+    levels = np.zeros((len(lines), int(lengths.max(initial=0))), dtype=np.int32)
+    levels[rows, columns] = values
+    return levels, lengths
+
+
+def safe_steps(levels: 'np.ndarray', lengths: 'np.ndarray', gap: int = 1) -> tuple['np.ndarray', 'np.ndarray']:
+    """
+    Whether every step from level i to level i + gap rises (falls) by 1 to 3, as two (reports, longest - gap)
+    boolean arrays. Steps past the end of a report count as safe, so they never fail a check.
+    """
+    steps = levels[:, gap:] - levels[:, :-gap]
+    padding = np.arange(steps.shape[1]) + gap >= lengths[:, None]
+    rising = ((steps >= 1) & (steps <= 3)) | padding
+    falling = ((steps <= -1) & (steps >= -3)) | padding
+    return rising, falling
+
+
+def count_safe_batch(levels: 'np.ndarray', lengths: 'np.ndarray') -> int:
+    rising, falling = safe_steps(levels, lengths)
+    return int(np.count_nonzero(rising.all(axis=1) | falling.all(axis=1)))
+
+
+def dampened_direction(steps: 'np.ndarray', skips: 'np.ndarray') -> 'np.ndarray':
+    """
+    Whether removing at most one level makes all steps safe in one direction, for every report at once.
+    Removing level r keeps the steps before r - 1 (a prefix), the steps from r + 1 on (a suffix) and adds
+    the skip from level r - 1 to r + 1. Prefixes and suffixes are logical accumulations; shifting them
+    against each other and the skips by one column checks every r in one go.
+    """
+    ones = np.ones((len(steps), 1), dtype=bool)
+    prefix = np.hstack([ones, np.logical_and.accumulate(steps, axis=1)])  # prefix[:, t]: steps before t are safe
+    suffix = np.hstack([np.logical_and.accumulate(steps[:, ::-1], axis=1)[:, ::-1], ones])  # steps from t on
+
+    # Column r: removing level r. The first and last level have no skip to bridge.
+    bridged = np.hstack([ones, skips, ones])
+    dampened = np.hstack([ones, prefix[:, :-1]]) & np.hstack([suffix[:, 1:], ones]) & bridged
+    return dampened.any(axis=1)
+
+
+def count_dampened_safe_batch(levels: 'np.ndarray', lengths: 'np.ndarray') -> int:
+    """Removing a level past the end of a report leaves it as it is, so the safe reports are counted as well"""
+    if levels.shape[1] < 3:
+        return len(levels)
+    rising, falling = safe_steps(levels, lengths)
+    skip_rising, skip_falling = safe_steps(levels, lengths, gap=2)
+    safe = dampened_direction(rising, skip_rising) | dampened_direction(falling, skip_falling)
+    return int(np.count_nonzero(safe))
+
+
+def batches(lines: Iterable[str], size: int = BATCH_SIZE) -> Iterator[list[str]]:
+    lines = (line for line in lines if line)
+    while batch := list(islice(lines, size)):
+        yield batch
+
+
+def count_batched(lines: Iterable[str], count_batch: Callable[['np.ndarray', 'np.ndarray'], int]) -> int:
+    """Count the reports accepted by a batch check, packing the lines batch by batch"""
+    return sum(count_batch(*pack_reports(batch)) for batch in batches(lines))
+
+
 class Day2(AocSolution):
 
     @property
@@ -149,15 +253,17 @@ class Day2(AocSolution):
 
     @solution(371)
     def solve_part1(self, input_data: InputSource) -> int:
-        reports = input_data.read_lists_of_integers(' ')
-        safe_reports = list(filter(is_safe, reports))
-        return len(safe_reports)
+        if np is not None:
+            return count_batched(input_data.read_as_iterator(), count_safe_batch)
+        reports = input_data.iter_int_rows(' ')
+        return sum(map(is_safe, reports))
 
     @solution(426)
     def solve_part2(self, input_data: InputSource) -> int:
-        reports = input_data.read_lists_of_integers(' ')
-        safe_reports = list(filter(is_dampened_safe, reports))
-        return len(safe_reports)
+        if np is not None:
+            return count_batched(input_data.read_as_iterator(), count_dampened_safe_batch)
+        reports = input_data.iter_int_rows(' ')
+        return sum(map(is_dampened_safe, reports))
 
 
 if __name__ == "__main__":
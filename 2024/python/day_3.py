@@ -1,4 +1,6 @@
 import re
+from itertools import chain
+from typing import Iterable
 
 from solution_base import AocSolution, solution, InputSource
 
@@ -71,26 +73,59 @@ from solution_base import AocSolution, solution, InputSource
 # results of just the enabled multiplications?
 
 
-def sum_of_mul(s: str) -> int:
-    operations = re.findall(r"mul\((\d{1,3}),(\d{1,3})\)", s)
-    return sum(int(x) * int(y) for x, y in operations)
+MUL = re.compile(r"mul\((\d{1,3}),(\d{1,3})\)")
+DO, DONT = "do()", "don't()"
+MAX_TOKEN = len("mul(999,999)")  # Longest instruction, a shorter tail of a chunk cannot hold a complete one
 
 
-def conditional_sum_of_mul(s: str) -> int:
-    res = 0
+def sum_of_products(memory: str, start: int, end: int) -> int:
+    """Sum of the mul instructions lying completely within memory[start:end], searched in place"""
+    return sum(int(x) * int(y) for x, y in MUL.findall(memory, start, end))
 
-    do_index = 0
-    dont_index = s.find("don't()")
 
-    while -1 < dont_index:
-        res += sum_of_mul(s[do_index:dont_index])
-        do_index = s.find("do()", dont_index)
-        if do_index == -1:
-            break
-        dont_index = s.find("don't()", do_index)
+def sum_of_mul(chunks: Iterable[str], conditional: bool = False) -> int:
+    """
+    Sum of the multiplications, with conditional=True only of those enabled by do() and not disabled by don't().
 
-    if -1 < do_index:
-        res += sum_of_mul(s[do_index:])
+    A single pass over the memory given in chunks. Whether mul is enabled is carried from chunk to chunk, the
+    next toggle is found with str.find and the regex only runs over the enabled ranges, without copying them.
+    An instruction can be split between two chunks, so the last MAX_TOKEN - 1 characters of a chunk are only
+    searched together with the next one. Instructions start with 'm' or 'd' and contain neither after that,
+    so the few mul instructions started before that cut but ending after it are picked up one by one.
+    """
+    res = 0
+    enabled = True
+    tail = ""
+
+    for chunk in chain(chunks, [None]):
+        if chunk is None:  # End of the memory, nothing can be split anymore
+            memory, cut = tail, len(tail)
+        else:
+            memory = tail + chunk
+            cut = max(len(memory) - MAX_TOKEN + 1, 0)
+
+        pos = 0
+        while conditional:
+            toggle = DONT if enabled else DO
+            index = memory.find(toggle, pos, cut + len(toggle) - 1)
+            if index == -1:
+                break
+            if enabled:
+                res += sum_of_products(memory, pos, index)
+            enabled = not enabled
+            pos = index + len(toggle)
+
+        resume = max(cut, pos)
+        if enabled:
+            res += sum_of_products(memory, pos, cut)
+            for match in MUL.finditer(memory, max(cut - MAX_TOKEN + 1, pos)):
+                if match.start() >= cut:
+                    break
+                if match.end() > cut:
+                    res += int(match[1]) * int(match[2])
+                    resume = match.end()
+
+        tail = memory[resume:]
 
     return res
 
@@ -111,13 +146,11 @@ class Day3(AocSolution):
 
     @solution(184122457)
     def solve_part1(self, input_data: InputSource) -> int:
-        memory = input_data.read_raw()
-        return sum_of_mul(memory)
+        return sum_of_mul(input_data.iter_chunks())
 
     @solution(107862689)
     def solve_part2(self, input_data: InputSource) -> int:
-        memory = input_data.read_raw()
-        return conditional_sum_of_mul(memory)
+        return sum_of_mul(input_data.iter_chunks(), conditional=True)
 
 
 if __name__ == "__main__":
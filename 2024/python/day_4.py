@@ -1,8 +1,13 @@
-import re
-from itertools import product
+from typing import Iterable, Optional, Sequence
 
+from grid import Grid
 from solution_base import AocSolution, solution, InputSource
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, without it the words are searched cell by cell
+    np = None
+
 
 # -------------------
 # Part 1: Description
@@ -91,47 +96,106 @@ from solution_base import AocSolution, solution, InputSource
 # side and try again. How many times does an X-MAS appear?
 
 
-def extract_diagonal(rows: list[str], start_x: int, start_y: int, dx: int, dy: int) -> str:
-    """Extract a single diagonal starting from (start_x, start_y) with direction (dx, dy)."""
-    diagonal = []
-    x, y = start_x, start_y
-    while 0 <= x < len(rows[0]) and 0 <= y < len(rows):
-        diagonal.append(rows[y][x])
-        x += dx
-        y += dy
-    return ''.join(diagonal)
-
-
-def get_diagonals_left(rows, cols):
-    """Extract top-left to bottom-right diagonals."""
-    diagonals = []
-    # Diagonals starting from the first row
-    for x in range(len(cols)):
-        diagonals.append(extract_diagonal(rows, x, 0, 1, 1))
-    # Diagonals starting from the first column
-    for y in range(1, len(rows)):
-        diagonals.append(extract_diagonal(rows, 0, y, 1, 1))
-    return diagonals
-
-
-def get_diagonals_right(rows, cols):
-    """Extract bottom-left to top-right diagonals."""
-    diagonals = []
-    # Diagonals starting from the last row
-    for x in range(len(cols)):
-        diagonals.append(extract_diagonal(rows, x, len(rows) - 1, 1, -1))
-    # Diagonals starting from the first column
-    for y in range(1, len(rows) - 1):
-        diagonals.append(extract_diagonal(rows, 0, y, 1, -1))
-    return diagonals
-
-
-x_mas_patterns = [
-    [(-1, -1, 'M'), (-1, +1, 'M'), (+1, -1, 'S'), (+1, +1, 'S')],  # Ms on left
-    [(-1, -1, 'M'), (+1, -1, 'M'), (-1, +1, 'S'), (+1, +1, 'S')],  # Ms above
-    [(+1, +1, 'M'), (+1, -1, 'M'), (-1, -1, 'S'), (-1, +1, 'S')],  # Ms on right
-    [(+1, +1, 'M'), (-1, +1, 'M'), (-1, -1, 'S'), (+1, -1, 'S')],  # Ms below
-]
+def check_padding(grid: Grid, reach: int) -> None:
+    if grid.padding < reach:
+        raise ValueError(f"The grid needs a padding of at least {reach} cells, it has {grid.padding}")
+
+
+def matches_at(cells: bytearray, start: int, offset: int, word: bytes) -> bool:
+    """Whether the word is written from cell index start on, a step of offset per letter"""
+    for letter in word:
+        if cells[start] != letter:
+            return False
+        start += offset
+    return True
+
+
+def count_word(grid: Grid, word: str, offsets: Optional[Sequence[int]] = None) -> int:
+    """
+    Occurrences of the word in the given directions (default: all 8), found from every cell holding its first
+    letter by stride arithmetic on the flat cells. The padding of the grid must cover the word, so a walk
+    ends on the border instead of leaving the cells. A palindrome is found once per reading direction.
+    """
+    word = word.encode()
+    check_padding(grid, len(word) - 1)
+    cells = grid.cells
+    offsets = grid.neighbours if offsets is None else offsets
+    if len(word) == 1:
+        return grid.count(word) * len(offsets)
+
+    # Most walks already fail on the second letter, which is checked inline
+    second, rest = word[1], word[1:]
+    count = 0
+    for anchor in grid.find_all(word[:1]):
+        for offset in offsets:
+            if cells[anchor + offset] == second and matches_at(cells, anchor + offset, offset, rest):
+                count += 1
+    return count
+
+
+def count_words(grid: Grid, words: Iterable[str]) -> int:
+    return sum(count_word(grid, word) for word in words)
+
+
+def count_crosses(grid: Grid, word: str) -> int:
+    """
+    Occurrences of the word crossed with itself on both diagonals (an X-MAS for MAS): centred on the middle
+    letter and read forwards or backwards on each diagonal. The word needs an odd number of letters.
+    """
+    if len(word) % 2 == 0:
+        raise ValueError(f"Only words of odd length can cross in their middle letter, not '{word}'")
+    word = word.encode()
+    middle = len(word) // 2
+    check_padding(grid, middle)
+    cells = grid.cells
+
+    def on_diagonal(centre: int, offset: int) -> bool:
+        return (matches_at(cells, centre - middle * offset, offset, word)
+                or matches_at(cells, centre + middle * offset, -offset, word))
+
+    down_right, down_left = grid.down + grid.right, grid.down + grid.left
+    return sum(on_diagonal(centre, down_right) and on_diagonal(centre, down_left)
+               for centre in grid.find_all(word[middle:middle + 1]))
+
+
+def word_starts(flat: 'np.ndarray', word: bytes, offset: int) -> 'np.ndarray':
+    """
+    Boolean array over all cells: whether the word starts there in the direction of offset. Every letter is
+    compared against the whole grid shifted by its distance from the start, np.roll wraps around into the
+    border, which never matches a letter.
+    """
+    starts = flat == word[0]
+    for i in range(1, len(word)):
+        starts &= np.roll(flat, -i * offset) == word[i]
+    return starts
+
+
+def count_words_numpy(grid: Grid, words: Iterable[str]) -> int:
+    """Same count as count_words, with NumPy comparisons of the shifted grid"""
+    flat = np.frombuffer(grid.cells, dtype=np.uint8)
+    total = 0
+    for word in words:
+        word = word.encode()
+        check_padding(grid, len(word) - 1)
+        total += sum(int(np.count_nonzero(word_starts(flat, word, offset))) for offset in grid.neighbours)
+    return total
+
+
+def count_crosses_numpy(grid: Grid, word: str) -> int:
+    """Same count as count_crosses, the word starting from either end of both diagonals shifted to the centre"""
+    if len(word) % 2 == 0:
+        raise ValueError(f"Only words of odd length can cross in their middle letter, not '{word}'")
+    word = word.encode()
+    middle = len(word) // 2
+    check_padding(grid, middle)
+    flat = np.frombuffer(grid.cells, dtype=np.uint8)
+
+    crossed = np.ones(len(flat), dtype=bool)
+    for offset in (grid.down + grid.right, grid.down + grid.left):
+        forwards = np.roll(word_starts(flat, word, offset), middle * offset)
+        backwards = np.roll(word_starts(flat, word, -offset), -middle * offset)
+        crossed &= forwards | backwards
+    return int(np.count_nonzero(crossed))
 
 
 class Day4(AocSolution):
@@ -148,38 +212,20 @@ class Day4(AocSolution):
     def question_part2(self) -> str:
         return "How many times does an X-MAS appear?"
 
-    @solution(2557)
-    def solve_part1(self, input_data: InputSource) -> int:
-        rows = input_data.read_lines()
-        cols = list(map(''.join, zip(*rows)))
-
-        horizontal = '-'.join(rows)
-        vertical = '-'.join(cols)
-        diagonals_left = '-'.join(get_diagonals_left(rows, cols))
-        diagonals_right = '-'.join(get_diagonals_right(rows, cols))
+    def parse(self, input_data: InputSource) -> Grid:
+        return Grid.from_input(input_data, padding=len("XMAS"))
 
-        all_directions = '-'.join([horizontal, vertical, diagonals_left, diagonals_right])
-
-        occurrences = re.findall(r"(?=XMAS|SAMX)", all_directions)
-        return len(occurrences)
+    @solution(2557)
+    def solve_part1(self, grid: Grid) -> int:
+        if np is not None:
+            return count_words_numpy(grid, ["XMAS"])
+        return count_words(grid, ["XMAS"])
 
     @solution(1854)
-    def solve_part2(self, input_data: InputSource) -> int:
-        rows = input_data.read_lines()
-
-        def get_all_coordinates() -> list[tuple[int]]:
-            x_range = range(1, len(rows[0]) - 1)
-            y_range = range(1, len(rows) - 1)
-            return list(product(x_range, y_range))
-
-        count = 0
-        for x, y in get_all_coordinates():
-            if rows[y][x] != 'A':
-                continue
-            for pattern in x_mas_patterns:
-                if all(rows[y + dy][x + dx] == char for dx, dy, char in pattern):
-                    count += 1
-        return count
+    def solve_part2(self, grid: Grid) -> int:
+        if np is not None:
+            return count_crosses_numpy(grid, "MAS")
+        return count_crosses(grid, "MAS")
 
 
 if __name__ == "__main__":
@@ -1,4 +1,6 @@
-from collections import defaultdict, deque
+from functools import cmp_to_key
+from itertools import combinations
+from typing import Iterator
 
 from solution_base import AocSolution, solution, InputSource
 
@@ -144,62 +146,45 @@ from solution_base import AocSolution, solution, InputSource
 # add up the middle page numbers after correctly ordering just those updates?
 
 
-def prepare_input(file_content: str) -> tuple[list[tuple[int]], list[list[int]]]:
-    sections = file_content.split('\n\n')
-    rules_raw, updates_raw = sections[0].splitlines(), sections[1].splitlines()
+# Ordering rules as a set of (before, after) page pairs
+Rules = set[tuple[int, int]]
 
-    rules = [tuple(map(int, rule.split('|'))) for rule in rules_raw]
-    updates = [list(map(int, update.split(','))) for update in updates_raw]
 
-    return rules, updates
+def prepare_input(input_data: InputSource) -> tuple[Rules, Iterator[list[int]]]:
+    """Read the rules eagerly into a set of ordered pairs and stream the updates one line at a time"""
+    sections = input_data.iter_sections()
+    rules = {tuple(map(int, rule.split('|'))) for rule in next(sections)}
+    return rules, parse_updates(sections)
 
 
-def is_valid_update(update: list[int], rules: list[tuple[int]]) -> bool:
-    for x, y in rules:
-        try:
-            if update.index(x) > update.index(y):
-                return False
-        except ValueError:
-            pass
-    return True
+def parse_updates(sections: Iterator[Iterator[str]]) -> Iterator[list[int]]:
+    for update in next(sections):
+        yield list(map(int, update.split(',')))
 
 
-def middle_number(update: list[int]) -> int:
-    return update[len(update) // 2]
-
-
-def create_graph(rules: list[tuple[int]]) -> tuple[dict[int, list[int]], dict[int]]:
-    graph = defaultdict(list)
-    in_degree = defaultdict(int)
-
-    for x, y in rules:
-        graph[x].append(y)
-        in_degree[y] += 1
-        if x not in in_degree:
-            in_degree[x] = 0
+def is_valid_update(update: list[int], rules: Rules) -> bool:
+    """No two pages are printed against a rule: O(len(update)^2) set lookups, independent of the number of rules"""
+    return not any((later, earlier) in rules for earlier, later in combinations(update, 2))
 
-    return graph, in_degree
 
+def middle_number(update: list[int]) -> int:
+    return update[len(update) // 2]
 
-def reorder_update(update: list[int], rules: list[tuple[int]]) -> list[int]:
-    """Reordering the update according to the given rules using Topology Sort"""
-
-    relevant_rules = list(filter(lambda rule: rule[0] in update and rule[1] in update, rules))
-    graph, in_degrees = create_graph(relevant_rules)
-
-    queue = deque([node for node in update if in_degrees[node] == 0])
-    sorted_order = []
 
-    while queue:
-        curr = queue.popleft()
-        sorted_order.append(curr)
+def reorder_update(update: list[int], rules: Rules) -> list[int]:
+    """
+    Sort the update with a comparator backed by the rules. As in the puzzle, the rules have to order every pair
+    of pages in an update consistently; pages without a rule between them compare as equal.
+    """
 
-        for neighbor in graph[curr]:
-            in_degrees[neighbor] -= 1
-            if in_degrees[neighbor] == 0:
-                queue.append(neighbor)
+    def compare(x: int, y: int) -> int:
+        if (x, y) in rules:
+            return -1
+        if (y, x) in rules:
+            return 1
+        return 0
 
-    return sorted_order
+    return sorted(update, key=cmp_to_key(compare))
 
 
 class Day5(AocSolution):
@@ -218,22 +203,20 @@ class Day5(AocSolution):
 
     @solution(7024)
     def solve_part1(self, input_data: InputSource) -> int:
-        rules, updates = prepare_input(input_data.read_raw())
+        rules, updates = prepare_input(input_data)
 
-        valid_updates = list(filter(lambda update: is_valid_update(update, rules), updates))
+        valid_updates = filter(lambda update: is_valid_update(update, rules), updates)
 
-        middle_numbers = list(map(middle_number, valid_updates))
-        return sum(middle_numbers)
+        return sum(map(middle_number, valid_updates))
 
     @solution(4151)
     def solve_part2(self, input_data: InputSource) -> int:
-        rules, updates = prepare_input(input_data.read_raw())
+        rules, updates = prepare_input(input_data)
 
-        invalid_updates = [update for update in updates if not is_valid_update(update, rules)]
-        reordered_updates = [reorder_update(update, rules) for update in invalid_updates]
+        invalid_updates = (update for update in updates if not is_valid_update(update, rules))
+        reordered_updates = (reorder_update(update, rules) for update in invalid_updates)
 
-        middle_numbers = list(map(middle_number, reordered_updates))
-        return sum(middle_numbers)
+        return sum(map(middle_number, reordered_updates))
 
 
 if __name__ == "__main__":
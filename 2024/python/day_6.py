@@ -1,6 +1,10 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from typing import Set, TypeAlias
 
+from grid import BORDER, Grid
 from solution_base import AocSolution, solution, InputSource
 
 
@@ -252,48 +256,26 @@ class DIR(Enum):
 
 
 Coord: TypeAlias = tuple[int, int]  # (x, y)
-Position: TypeAlias = tuple[Coord, int]  # ((x, y), direction)
-Grid: TypeAlias = list[list[str]]
+Position: TypeAlias = tuple[int, int]  # (cell index, direction)
 
-directions = [
-    (0, -1),  # up
-    (1, 0),  # right
-    (0, 1),  # down
-    (-1, 0)  # left
-]
+OBSTACLE = ord('#')
 
 
 def find_start_position(grid: Grid) -> Position:
-    for y, row in enumerate(grid):
-        try:
-            x = row.index('^')
-            return (x, y), DIR.UP.value
-        except ValueError:
-            continue
-    raise ValueError("There is no starting point")
+    start = grid.find(b'^')
+    if start is None:
+        raise ValueError("There is no starting point")
+    return start, DIR.UP.value
 
 
-def out_of_bounds(coord: Coord, grid: Grid) -> bool:
-    x, y = coord
-    x_out = x < 0 or len(grid[0]) <= x
-    y_out = y < 0 or len(grid) <= y
-    return x_out or y_out
-
-
-def is_obstacle(coord: Coord, grid: Grid) -> bool:
-    x, y = coord
-    return grid[y][x] == '#'
-
-
-def step(pos: Position) -> Position:
-    (x, y), direction = pos
-    dx, dy = directions[direction]
-    return (x + dx, y + dy), direction
+def step(grid: Grid, pos: Position) -> Position:
+    index, direction = pos
+    return index + grid.directions[direction], direction
 
 
 def turn(pos: Position) -> Position:
-    coord, direction = pos
-    return coord, (direction + 1) % 4
+    index, direction = pos
+    return index, (direction + 1) % 4
 
 
 def find_path(grid: Grid, start_pos: Position) -> list[Position]:
@@ -301,12 +283,12 @@ def find_path(grid: Grid, start_pos: Position) -> list[Position]:
 
     curr_pos = start_pos
     while True:
-        next_pos = step(curr_pos)
-        next_coord = next_pos[0]
-        if out_of_bounds(next_coord, grid):
+        next_pos = step(grid, curr_pos)
+        cell = grid[next_pos[0]]
+        if cell == BORDER:
             break
 
-        if is_obstacle(next_coord, grid):
+        if cell == OBSTACLE:
             next_pos = turn(curr_pos)
         path.append(next_pos)
         curr_pos = next_pos
@@ -314,28 +296,139 @@ def find_path(grid: Grid, start_pos: Position) -> list[Position]:
     return path
 
 
-def path_loops(grid: Grid, obstacle: Coord, start_pos: Position, previous_corners: Set[Position]) -> bool:
-    visited_corners = previous_corners.copy()
-
-    curr_pos = start_pos
-    corner_to_add: Position | None = None
-
+class ObstacleIndex:
+    """
+    Sorted obstacle coordinates of every row and column, so the next obstacle in any direction is one bisect away.
+    Every obstacle has an id, and (id, direction) identifies the state of the guard turning in front of it.
+    """
+
+    def __init__(self, grid: Grid):
+        self.width = grid.width
+        self.height = grid.height
+        self.row_obstacles: list[list[int]] = [[] for _ in range(grid.height)]  # x of the obstacles per row
+        self.row_ids: list[list[int]] = [[] for _ in range(grid.height)]
+        self.col_obstacles: list[list[int]] = [[] for _ in range(grid.width)]  # y of the obstacles per column
+        self.col_ids: list[list[int]] = [[] for _ in range(grid.width)]
+
+        # find_all yields the obstacles row by row, so all lists end up sorted
+        self.ids: dict[int, int] = {}  # Cell index of an obstacle -> id
+        self.count = 0
+        for index in grid.find_all(b'#'):
+            x, y = grid.coord(index)
+            self.ids[index] = self.count
+            self.row_obstacles[y].append(x)
+            self.row_ids[y].append(self.count)
+            self.col_obstacles[x].append(y)
+            self.col_ids[x].append(self.count)
+            self.count += 1
+
+
+def path_loops(index: ObstacleIndex, obstacle: Coord, start: Coord, direction: int, visited: array,
+               passed_at: array, stamp: int) -> bool:
+    """
+    Whether the guard walking from start in direction is trapped in a loop once obstacle is added.
+    Each leg up to the next obstacle is one bisect; the added obstacle is patched in only when it lies in the
+    row or column of the leg. Turning states are stamped in visited (4 entries per obstacle id, the added
+    obstacle has the id index.count), so nothing needs to be reset between candidates as long as stamps differ.
+    States the original path passed before this candidate (passed_at below stamp) lead back to start,
+    reaching one of them is a loop as well.
+    """
+    ox, oy = obstacle
+    x, y = start
+    row_obstacles, row_ids = index.row_obstacles, index.row_ids
+    col_obstacles, col_ids = index.col_obstacles, index.col_ids
+    added_id = index.count
     while True:
-        if curr_pos in visited_corners:
+        if direction == 0:  # up
+            column = col_obstacles[x]
+            i = bisect_left(column, y) - 1
+            hit_y, hit_id = (column[i], col_ids[x][i]) if i >= 0 else (-1, -1)
+            if ox == x and hit_y < oy < y:
+                hit_y, hit_id = oy, added_id
+            if hit_id < 0:
+                return False
+            y = hit_y + 1
+        elif direction == 1:  # right
+            row = row_obstacles[y]
+            i = bisect_right(row, x)
+            hit_x, hit_id = (row[i], row_ids[y][i]) if i < len(row) else (index.width, -1)
+            if oy == y and x < ox < hit_x:
+                hit_x, hit_id = ox, added_id
+            if hit_id < 0:
+                return False
+            x = hit_x - 1
+        elif direction == 2:  # down
+            column = col_obstacles[x]
+            i = bisect_right(column, y)
+            hit_y, hit_id = (column[i], col_ids[x][i]) if i < len(column) else (index.height, -1)
+            if ox == x and y < oy < hit_y:
+                hit_y, hit_id = oy, added_id
+            if hit_id < 0:
+                return False
+            y = hit_y - 1
+        else:  # left
+            row = row_obstacles[y]
+            i = bisect_left(row, x) - 1
+            hit_x, hit_id = (row[i], row_ids[y][i]) if i >= 0 else (-1, -1)
+            if oy == y and hit_x < ox < x:
+                hit_x, hit_id = ox, added_id
+            if hit_id < 0:
+                return False
+            x = hit_x + 1
+
+        state = hit_id * 4 + direction
+        if visited[state] == stamp or passed_at[state] < stamp:
             return True
-        if corner_to_add:
-            visited_corners.add(corner_to_add)
-            corner_to_add = None
+        visited[state] = stamp
+        direction = (direction + 1) % 4
 
-        next_pos = step(curr_pos)
-        next_coord = next_pos[0]
-        if out_of_bounds(next_coord, grid):
-            return False
 
-        if is_obstacle(next_coord, grid) or next_coord == obstacle:
-            next_pos = turn(curr_pos)
-            corner_to_add = next_pos
+Candidate: TypeAlias = tuple[int, Coord, Coord, int]  # (stamp, obstacle, guard position, guard direction)
+
+
+def find_candidates(grid: Grid, path: list[Position], index: ObstacleIndex) -> tuple[list[Candidate], array]:
+    """
+    Every cell of the path is a candidate obstacle, placed right before the first time the guard gets there.
+    Each candidate is stamped with its step on the path. passed_at holds the step after which the path first
+    passes each turning state, or len(path) if it never does.
+    """
+    passed_at = array('i', [len(path)]) * (4 * (index.count + 1))
+    candidates = []
+
+    tested_cells: Set[int] = {path[0][0]}
+    curr_pos = path[0]
+    for stamp, next_pos in enumerate(path[1:]):
+        obstacle, next_dir = next_pos
+        cell, direction = curr_pos
+        if obstacle not in tested_cells:
+            tested_cells.add(obstacle)
+            candidates.append((stamp, grid.coord(obstacle), grid.coord(cell), direction))
+
+        if next_dir != direction:
+            passed_at[index.ids[cell + grid.directions[direction]] * 4 + direction] = stamp
+
         curr_pos = next_pos
+    return candidates, passed_at
+
+
+def count_loops(index: ObstacleIndex, passed_at: array, candidates: list[Candidate]) -> int:
+    visited = array('i', [-1]) * len(passed_at)
+    return sum(path_loops(index, obstacle, start, direction, visited, passed_at, stamp)
+               for stamp, obstacle, start, direction in candidates)
+
+
+# Obstacle index and passed_at of a worker process, sent once when the worker starts
+_worker_state: tuple[ObstacleIndex, array] | None = None
+
+
+def _init_worker(index: ObstacleIndex, passed_at: array) -> None:
+    global _worker_state
+    _worker_state = index, passed_at
+
+
+def _count_loops_batch(candidates: list[Candidate]) -> int:
+    index, passed_at = _worker_state
+    return count_loops(index, passed_at, candidates)
 
 
 class Day6(AocSolution):
@@ -352,54 +445,41 @@ class Day6(AocSolution):
     def question_part2(self) -> str:
         return "How many different positions could you choose for this obstruction?"
 
-    @solution(4758)
-    def solve_part1(self, input_data: InputSource) -> int:
-        grid = input_data.read_char_grid()
+    def parse(self, input_data: InputSource) -> Grid:
+        return Grid.from_input(input_data)
 
+    @solution(4758)
+    def solve_part1(self, grid: Grid) -> int:
         start = find_start_position(grid)
         path = find_path(grid, start)
 
-        distinct_coords = set([pos[0] for pos in path])
-        return len(distinct_coords)
+        distinct_cells = set([pos[0] for pos in path])
+        return len(distinct_cells)
 
     @solution(1670)
-    def solve_part2(self, input_data: InputSource) -> int:
-        grid = input_data.read_char_grid()
-
+    def solve_part2(self, grid: Grid) -> int:
         start_pos = find_start_position(grid)
         path = find_path(grid, start_pos)
+        index = ObstacleIndex(grid)
 
-        possible_obstacles = set()
-        total_positions = len(path)
-        loops_found = 0
-
-        progress = self.create_progress(total_positions, 'Searching for loops')
-
-        visited_corners: Set[Position] = set()
-        tested_coords: Set[Coord] = set()
-        curr_pos = start_pos
-        corner_to_add: Position | None = None
-        for next_pos in path[1:]:
-            progress.update()
-
-            obstacle, next_dir = next_pos
-            if obstacle in tested_coords:
-                continue
+        candidates, passed_at = find_candidates(grid, path, index)
 
-            if path_loops(grid, obstacle, curr_pos, visited_corners):
-                loops_found += 1
-                possible_obstacles.add(obstacle)
-
-            tested_coords.add(obstacle)
-
-            if corner_to_add:
-                visited_corners.add(corner_to_add)
-                corner_to_add = None
-
-            if next_dir != curr_pos[1]:
-                corner_to_add = next_pos
+        # Every candidate is independent, they are checked in batches, in parallel with more than one worker
+        batch_size = max(1, -(-len(candidates) // (self.workers * 16)))
+        batches = [candidates[i:i + batch_size] for i in range(0, len(candidates), batch_size)]
+        loops_found = 0
 
-            curr_pos = next_pos
+        progress = self.create_progress(len(candidates), 'Searching for loops')
+        if self.workers > 1:
+            with ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                     initargs=(index, passed_at)) as executor:
+                for batch, loops in zip(batches, executor.map(_count_loops_batch, batches)):
+                    loops_found += loops
+                    progress.update(len(batch))
+        else:
+            for batch in batches:
+                loops_found += count_loops(index, passed_at, batch)
+                progress.update(len(batch))
 
         progress.finish()
         return loops_found
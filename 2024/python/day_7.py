@@ -1,6 +1,7 @@
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
-from itertools import product
+from typing import Callable, Optional
 
 from solution_base import AocSolution, solution, InputSource
 
@@ -115,57 +116,70 @@ def extract_equations(lines: list[str]) -> list[Equation]:
     return equations
 
 
-def evaluate(operators: list[Operator], numbers: list[int]) -> int:
-    result = numbers[0]
-    for op, num in zip(operators, numbers[1:]):
-        match op:
-            case Operator.PLUS:
-                result += num
-            case Operator.TIMES:
-                result *= num
-            case Operator.CONCATENATE:
-                result = int(str(result) + str(num))
+def undo_plus(target: int, num: int) -> Optional[int]:
+    return target - num if target >= num else None
 
-    return result
 
+def undo_times(target: int, num: int) -> Optional[int]:
+    return target // num if num and target % num == 0 else None
 
-def is_achievable_equation(eq: Equation, operators: list[Operator]) -> bool:
-    op_combinations = list(product(operators, repeat=len(eq.numbers) - 1))
-
-    for combination in op_combinations:
-        if evaluate(combination, eq.numbers) == eq.result:
-            return True
-
-    return False
-
-
-def test_equation_rec(available_operators: list[Operator],
-                      numbers: list[int],
-                      exp_result: int,
-                      curr_value: int) -> bool:
-    if len(numbers) == 0:
-        return curr_value == exp_result
-
-    for op in available_operators:
-        new_value = curr_value
-        if op == Operator.PLUS:
-            new_value += numbers[0]
-        elif op == Operator.TIMES:
-            new_value *= numbers[0]
-        elif op == Operator.CONCATENATE:
-            new_value = int(str(new_value) + str(numbers[0]))
 
-        if new_value > exp_result:
-            continue
+def undo_concatenate(target: int, num: int) -> Optional[int]:
+    power = 10
+    while power <= num:
+        power *= 10
+    return target // power if target % power == num else None
 
-        if test_equation_rec(available_operators, numbers[1:], exp_result, new_value):
-            return True
 
-    return False
+# Inverse of every operator: the value left of it, given the result and the number right of it, or None if the
+# result cannot be reached that way. Supporting a new operator only needs a new entry here.
+INVERSES: dict[Operator, Callable[[int, int], Optional[int]]] = {
+    Operator.PLUS: undo_plus,
+    Operator.TIMES: undo_times,
+    Operator.CONCATENATE: undo_concatenate,
+}
 
 
-def is_achievable_equation_rec(eq: Equation, operators: list[Operator]) -> bool:
-    return test_equation_rec(operators, eq.numbers[1:], eq.result, eq.numbers[0])
+def is_achievable_equation(eq: Equation, operators: list[Operator]) -> bool:
+    """
+    Search backwards from the result: the last number is undone with every operator, then the one before it.
+    Most branches die immediately (no remainder-free division, no matching suffix, a negative rest), and
+    (index, rest) pairs that already failed are not searched again.
+    """
+    inverses = [INVERSES[op] for op in operators]
+    multiplies = Operator.TIMES in operators
+    numbers = eq.numbers
+    failed: set[tuple[int, int]] = set()
+
+    def reaches(index: int, target: int) -> bool:
+        if index == 0:
+            return target == numbers[0]
+        if (index, target) in failed:
+            return False
+        num = numbers[index]
+        if multiplies and num == 0 and target == 0:
+            return True  # Multiplying by zero reaches 0 from any left value, it cannot be undone by division
+        for inverse in inverses:
+            previous = inverse(target, num)
+            if previous is not None and reaches(index - 1, previous):
+                return True
+        failed.add((index, target))
+        return False
+
+    return reaches(len(numbers) - 1, eq.result)
+
+
+def sum_achievable(equations: list[Equation], operators: list[Operator]) -> int:
+    return sum(eq.result for eq in equations if is_achievable_equation(eq, operators))
+
+
+def shard_equations(equations: list[Equation], shards: int) -> list[list[Equation]]:
+    """
+    Split the equations into shards of similar cost: sorted by operand count (longest first) and dealt out
+    round-robin, so every shard gets its share of the long equations and starts with them.
+    """
+    ordered = sorted(equations, key=lambda eq: len(eq.numbers), reverse=True)
+    return [ordered[i::shards] for i in range(min(shards, len(ordered)))]
 
 
 class Day7(AocSolution):
@@ -182,31 +196,34 @@ class Day7(AocSolution):
     def question_part2(self) -> str:
         return "How does the result change when adding a concatenation operator '||'?"
 
+    def total_calibration_result(self, equations: list[Equation], operators: list[Operator]) -> int:
+        """Sum of the results of the achievable equations, tested in shards on worker processes if there are any"""
+        if self.workers <= 1:
+            return sum_achievable(equations, operators)
+
+        shards = shard_equations(equations, self.workers * 4)
+        total = 0
+
+        progress = self.create_progress(len(equations), 'Testing Equations')
+        with ProcessPoolExecutor(self.workers) as executor:
+            for shard, result in zip(shards, executor.map(sum_achievable, shards, [operators] * len(shards))):
+                total += result
+                progress.update(len(shard))
+        progress.finish()
+
+        return total
+
     @solution(21572148763543)
     def solve_part1(self, input_data: InputSource) -> int:
         equations = extract_equations(input_data.read_lines())
         operators = [Operator.PLUS, Operator.TIMES]
-        equations = list(filter(lambda eq: is_achievable_equation_rec(eq, operators), equations))
-
-        self.logger.debug(equations)
-
-        return sum([eq.result for eq in equations])
+        return self.total_calibration_result(equations, operators)
 
     @solution(581941094529163)
     def solve_part2(self, input_data: InputSource) -> int:
         equations = extract_equations(input_data.read_lines())
         operators = [Operator.PLUS, Operator.TIMES, Operator.CONCATENATE]
-
-        possible = []
-
-        progress = self.create_progress(len(equations), 'Testing Equations')
-        for eq in equations:
-            progress.update()
-            if is_achievable_equation_rec(eq, operators):
-                possible.append(eq)
-        progress.finish()
-
-        return sum([eq.result for eq in possible])
+        return self.total_calibration_result(equations, operators)
 
 
 if __name__ == "__main__":
@@ -215,5 +232,8 @@ if __name__ == "__main__":
     # Run with example data in debug mode
     # solution.run(part=None, is_example=True, debug=False)
 
+    # Run with example data containing zero operands (5 * 0 and 3 * 0 + 10 are both achievable)
+    # solution.run(part=None, is_example=True, example_suffix='zero', debug=False)
+
     # Run both parts with real input
     solution.run()
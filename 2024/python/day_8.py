@@ -1,5 +1,6 @@
 import itertools
 
+from grid import Grid
 from solution_base import AocSolution, solution, InputSource
 
 # -------------------
@@ -160,19 +161,18 @@ from solution_base import AocSolution, solution, InputSource
 
 
 Coord = tuple[int, int]
-Grid = list[list[str]]
 
 
 def find_antennas(grid: Grid) -> dict[str, list[Coord]]:
     antennas = {}
-    for y, row in enumerate(grid):
-        for x, cell in enumerate(row):
-            if cell.isalnum():
-                antennas.setdefault(cell, []).append((x, y))
+    for frequency in grid.values():
+        if not bytes([frequency]).isalnum():
+            continue
+        antennas[chr(frequency)] = [grid.coord(index) for index in grid.find_all(bytes([frequency]))]
     return antennas
 
 
-def find_direct_antinodes(antennas_by_type: dict[str, list[Coord]]) -> dict[str, set[Coord]]:
+def find_direct_antinodes(antennas_by_type: dict[str, list[Coord]], grid: Grid) -> dict[str, set[int]]:
     antinodes = dict()
     for t, antennas in antennas_by_type.items():
         antinodes.setdefault(t, set())
@@ -182,11 +182,13 @@ def find_direct_antinodes(antennas_by_type: dict[str, list[Coord]]) -> dict[str,
             xb, yb = b
             dx = xb - xa
             dy = yb - ya
-            antinodes.get(t).add((xa + 2 * dx, ya + 2 * dy))
+            new_x, new_y = xa + 2 * dx, ya + 2 * dy
+            if grid.contains(new_x, new_y):
+                antinodes.get(t).add(grid.index(new_x, new_y))
     return antinodes
 
 
-def find_all_antinodes(antennas_by_type: dict[str, list[Coord]], grid: Grid) -> dict[str, set[Coord]]:
+def find_all_antinodes(antennas_by_type: dict[str, list[Coord]], grid: Grid) -> dict[str, set[int]]:
     antinodes = dict()
     for t, antennas in antennas_by_type.items():
         antinodes.setdefault(t, set())
@@ -199,18 +201,13 @@ def find_all_antinodes(antennas_by_type: dict[str, list[Coord]], grid: Grid) ->
             i = 1
             while True:
                 new_x, new_y = xa + i * dx, ya + i * dy
-                if not is_in_bounds(grid, (new_x, new_y)):
+                if not grid.contains(new_x, new_y):
                     break
-                antinodes.get(t).add((new_x, new_y))
+                antinodes.get(t).add(grid.index(new_x, new_y))
                 i += 1
     return antinodes
 
 
-def is_in_bounds(grid: Grid, coord: Coord) -> bool:
-    x, y = coord
-    return 0 <= x < len(grid[0]) and 0 <= y < len(grid)
-
-
 class Day8(AocSolution):
 
     @property
@@ -225,23 +222,20 @@ class Day8(AocSolution):
     def question_part2(self) -> str:
         return "How many unique locations within the bounds of the map contain an antinode using the new model?"
 
+    def parse(self, input_data: InputSource) -> Grid:
+        return Grid.from_input(input_data)
+
     @solution(344)
-    def solve_part1(self, input_data: InputSource) -> int:
-        grid = input_data.read_char_grid()
+    def solve_part1(self, grid: Grid) -> int:
         antennas_by_type = find_antennas(grid)
-        antinodes = find_direct_antinodes(antennas_by_type)
-        all_antinodes = set(itertools.chain(*antinodes.values()))
-        antinodes_in_bounds = list(filter(lambda coord: is_in_bounds(grid, coord), all_antinodes))
-        return len(antinodes_in_bounds)
+        antinodes = find_direct_antinodes(antennas_by_type, grid)
+        return len(set(itertools.chain(*antinodes.values())))
 
     @solution(1182)
-    def solve_part2(self, input_data: InputSource) -> int:
-        grid = input_data.read_char_grid()
+    def solve_part2(self, grid: Grid) -> int:
         antennas_by_type = find_antennas(grid)
         antinodes = find_all_antinodes(antennas_by_type, grid)
-        all_antinodes = set(itertools.chain(*antinodes.values()))
-        antinodes_in_bounds = list(filter(lambda coord: is_in_bounds(grid, coord), all_antinodes))
-        return len(antinodes_in_bounds)
+        return len(set(itertools.chain(*antinodes.values())))
 
 
 if __name__ == "__main__":
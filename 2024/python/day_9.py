@@ -1,5 +1,4 @@
-from itertools import repeat
-from typing import Optional
+import heapq
 
 from solution_base import AocSolution, solution, InputSource
 
@@ -134,69 +133,49 @@ def read_disk_map(input_data: InputSource) -> DiskMap:
     return disk_map
 
 
-def build_blocks(disk_map: DiskMap) -> list[str]:
-    blocks: list[str] = []
-    is_file = True
-    curr_id = 0
-    for _, _, block_length in disk_map:
-        content = '.'
-        if is_file:
-            content = str(curr_id)
-            curr_id = (curr_id + 1 % 10)
-        block = list(repeat(content, block_length))
-        blocks.extend(block)
-        is_file = not is_file
-    return blocks
-
-
-def find_leftmost_free_space(sorted_blocks: list[str], file_idx: int, file_size: int) -> Optional[int]:
-    free_space_idx = None
-    free_space_size = 0
-    for i in range(file_idx):
-        c = sorted_blocks[i]
-
-        if c.isnumeric():
-            free_space_idx = None
-            free_space_size = 0
-        else:
-            if not free_space_idx:
-                free_space_idx = i
-            free_space_size += 1
-
-        if free_space_size >= file_size:
-            return free_space_idx
-
-    return None
-
-
-def move_file(sorted_blocks: list[str], file_idx: int, size: int, free_space_idx: int) -> list[str]:
-    for i in range(size):
-        sorted_blocks[free_space_idx + i] = sorted_blocks[file_idx + i]
-        sorted_blocks[file_idx + i] = '.'
-    return sorted_blocks
+def span_checksum(file_id: int, start: int, length: int) -> int:
+    """Checksum of a file occupying length blocks from start: file_id * (start + ... + start + length - 1)"""
+    return file_id * (start * length + length * (length - 1) // 2)
 
 
-def sort_blocks(blocks: list[str]) -> list[str]:
-    sorted_blocks = blocks.copy()
-    i, j = 0, len(blocks) - 1
+def split_disk_map(disk_map: DiskMap) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+    """(start, length) of the files, in file id order, and of the free spaces"""
+    files = [(start, length) for is_file, start, length in disk_map if is_file]
+    free_spaces = [(start, length) for is_file, start, length in disk_map if not is_file]
+    return files, free_spaces
 
-    while True:
-        while sorted_blocks[i] != '.':
-            i += 1
-        while sorted_blocks[j] == '.':
-            j -= 1
-        if i >= j:
-            return sorted_blocks
-        sorted_blocks[i] = blocks[j]
-        sorted_blocks[j] = blocks[i]
 
-
-def calc_checksum(blocks: list[str]) -> int:
+def compact_blocks_checksum(disk_map: DiskMap) -> int:
+    """
+    Checksum after moving single blocks from the end into the leftmost free space.
+    Files are consumed from the right while the free spaces fill up from the left, span by span,
+    so no block is ever materialized.
+    """
+    files, free_spaces = split_disk_map(disk_map)
     checksum = 0
-    for idx, num in enumerate(blocks):
-        if num == '.':
+    last = len(files) - 1
+    remaining = files[last][1]  # Blocks of the last file that have not been moved yet
+
+    for file_id, (start, length) in enumerate(files):
+        if file_id >= last:
+            if file_id == last:
+                checksum += span_checksum(file_id, start, remaining)
+            break
+        checksum += span_checksum(file_id, start, length)
+        if file_id >= len(free_spaces):
             continue
-        checksum += idx * int(num)
+
+        free_start, free_length = free_spaces[file_id]
+        while free_length > 0 and last > file_id:
+            moved = min(free_length, remaining)
+            checksum += span_checksum(last, free_start, moved)
+            free_start += moved
+            free_length -= moved
+            remaining -= moved
+            if remaining == 0:
+                last -= 1
+                remaining = files[last][1]
+
     return checksum
 
 
@@ -217,33 +196,47 @@ class Day9(AocSolution):
     @solution(6386640365805)
     def solve_part1(self, input_data: InputSource) -> int:
         disk_map = read_disk_map(input_data)
-        blocks = build_blocks(disk_map)
-        sorted_blocks = sort_blocks(blocks)
-        return calc_checksum(sorted_blocks)
-
-    def sort_blocks_keeping_files_intact(self, blocks: list[str], disk_map: DiskMap) -> list[str]:
-        sorted_blocks = blocks.copy()
-        files_reversed = list(reversed([(idx, size) for is_file, idx, size in disk_map if is_file]))
-
-        progress = self.create_progress(len(files_reversed), 'Sorting Files')
-
-        for file_idx, size in files_reversed:
+        return compact_blocks_checksum(disk_map)
+
+    def compact_files_checksum(self, disk_map: DiskMap) -> int:
+        """
+        Checksum after moving whole files, highest id first, into the leftmost free space large enough.
+        Free spaces are kept in one min-heap of start offsets per length (1-9), so the leftmost fitting space
+        is the smallest top of the heaps for lengths >= the file size. What is left of a used space goes
+        back into the heap of its new length.
+        """
+        files, free_spaces = split_disk_map(disk_map)
+        free_by_length: list[list[int]] = [[] for _ in range(10)]
+        for start, length in free_spaces:
+            if length:
+                # Spaces arrive in ascending order, so every list is already a valid heap
+                free_by_length[length].append(start)
+
+        checksum = 0
+        progress = self.create_progress(len(files), 'Sorting Files')
+        for file_id in range(len(files) - 1, -1, -1):
             progress.update()
-            free_space_idx = find_leftmost_free_space(sorted_blocks, file_idx, size)
+            file_start, size = files[file_id]
 
-            if free_space_idx:
-                move_file(sorted_blocks, file_idx, size, free_space_idx)
+            best_start, best_length = file_start, 0
+            for length in range(size, 10):
+                heap = free_by_length[length]
+                if heap and heap[0] < best_start:
+                    best_start, best_length = heap[0], length
 
-        progress.finish()
+            if best_length:
+                heapq.heappop(free_by_length[best_length])
+                if best_length > size:
+                    heapq.heappush(free_by_length[best_length - size], best_start + size)
+            checksum += span_checksum(file_id, best_start, size)
 
-        return sorted_blocks
+        progress.finish()
+        return checksum
 
     @solution(6423258376982)
     def solve_part2(self, input_data: InputSource) -> int:
         disk_map = read_disk_map(input_data)
-        blocks = build_blocks(disk_map)
-        sorted_blocks = self.sort_blocks_keeping_files_intact(blocks, disk_map)
-        return calc_checksum(sorted_blocks)
+        return self.compact_files_checksum(disk_map)
 
 
 if __name__ == "__main__":
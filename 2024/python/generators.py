@@ -0,0 +1,235 @@
+import argparse
+import os
+import random
+import string
+from typing import Callable, Dict, Iterator, List
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_GENERATED_DIR = os.path.join(BASE_DIR, "generated")
+
+# Generators of valid, seeded puzzle inputs at arbitrary sizes, used to measure how the solvers scale.
+# Every generator takes the size and a seeded random number generator and yields the input line by line.
+# The meaning of the size depends on the day (number of rows, grid side, number of characters, ...).
+Generator = Callable[[int, random.Random], Iterator[str]]
+GENERATORS: Dict[int, Generator] = {}
+
+# Size ladders of the scaling benchmark, from puzzle-sized inputs to inputs way beyond them
+SIZE_LADDERS: Dict[int, List[int]] = {
+    1: [10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7],  # rows
+    2: [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6],  # reports
+    3: [10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7],  # characters of corrupted memory
+    4: [64, 128, 256, 512, 1024],  # grid side
+    5: [10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5],  # updates
+    6: [32, 64, 128, 256, 512, 1024, 2048, 4096],  # grid side
+    7: [100, 300, 1000, 3000, 10000],  # equations
+    8: [32, 64, 128, 256, 512, 1024],  # grid side
+    9: [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6],  # digits of the disk map
+    10: [32, 64, 128, 256, 512, 1024],  # grid side
+    11: [10, 100, 1000, 10 ** 4],  # stones
+}
+
+
+def generator(day: int) -> Callable[[Generator], Generator]:
+    """Register the input generator of a day"""
+
+    def decorator(func: Generator) -> Generator:
+        GENERATORS[day] = func
+        return func
+
+    return decorator
+
+
+@generator(1)
+def generate_location_lists(size: int, rng: random.Random) -> Iterator[str]:
+    """Two columns of five-digit location IDs"""
+    for _ in range(size):
+        yield f"{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}"
+
+
+@generator(2)
+def generate_reports(size: int, rng: random.Random) -> Iterator[str]:
+    """Reports of 5 to 8 levels; about half are monotone with small steps, some of them with one bad level"""
+    for _ in range(size):
+        length = rng.randint(5, 8)
+        if rng.random() < 0.5:
+            levels = [rng.randint(1, 99) for _ in range(length)]
+        else:
+            direction = rng.choice((-1, 1))
+            levels = [rng.randint(30, 70)]
+            for _ in range(length - 1):
+                levels.append(levels[-1] + direction * rng.randint(1, 3))
+            if rng.random() < 0.3:
+                levels[rng.randrange(length)] += rng.choice((-5, 0, 5))
+        yield " ".join(map(str, levels))
+
+
+@generator(3)
+def generate_corrupted_memory(size: int, rng: random.Random) -> Iterator[str]:
+    """Lines of about 3000 characters of junk with valid and broken mul, do and don't instructions"""
+    tokens = ["do()", "don't()", "mul(", ")", ",", "mul[", "what()", "from()", "select()"]
+    junk = string.punctuation.replace("\\", "") + " "
+    line: List[str] = []
+    line_length = 0
+    written = 0
+    while written < size:
+        roll = rng.random()
+        if roll < 0.08:
+            token = f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+        elif roll < 0.1:
+            token = rng.choice(tokens[:2])
+        elif roll < 0.2:
+            token = rng.choice(tokens[2:])
+        elif roll < 0.25:
+            token = str(rng.randint(0, 9999))
+        else:
+            token = rng.choice(junk)
+        line.append(token)
+        line_length += len(token)
+        written += len(token)
+        if line_length >= 3000:
+            yield "".join(line)
+            line, line_length = [], 0
+    if line:
+        yield "".join(line)
+
+
+@generator(4)
+def generate_word_search(size: int, rng: random.Random) -> Iterator[str]:
+    """Square grid of the letters X, M, A and S"""
+    for _ in range(size):
+        yield "".join(rng.choices("XMAS", k=size))
+
+
+@generator(5)
+def generate_print_queue(size: int, rng: random.Random) -> Iterator[str]:
+    """
+    Ordering rules for every pair of 49 pages, consistent with a random total order, followed by updates of an
+    odd number of distinct pages. About half of the updates are in the correct order.
+    """
+    order = rng.sample(range(10, 100), 49)
+    for i, before in enumerate(order):
+        for after in order[i + 1:]:
+            yield f"{before}|{after}"
+    yield ""
+
+    rank = {page: i for i, page in enumerate(order)}
+    for _ in range(size):
+        pages = rng.sample(order, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            pages.sort(key=rank.__getitem__)
+        yield ",".join(map(str, pages))
+
+
+@generator(6)
+def generate_guard_map(size: int, rng: random.Random) -> Iterator[str]:
+    """
+    Square grid with about 5% obstacles and the guard in the middle facing up.
+    Obstacles that trap the guard in a loop are removed until the guard's path leaves the grid.
+    """
+    obstacle, free = ord("#"), ord(".")
+    grid = bytearray(obstacle if rng.random() < 0.05 else free for _ in range(size * size))
+    start = size // 2 * size + size // 2
+    grid[start] = ord("^")
+
+    directions = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+    while True:
+        x, y, direction = start % size, start // size, 0
+        seen = set()
+        last_obstacle = None
+        while (x, y, direction) not in seen:
+            seen.add((x, y, direction))
+            dx, dy = directions[direction]
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < size and 0 <= ny < size):
+                break
+            if grid[ny * size + nx] == obstacle:
+                last_obstacle = ny * size + nx
+                direction = (direction + 1) % 4
+            else:
+                x, y = nx, ny
+        else:
+            # The guard is stuck in a loop, open it up at the obstacle that closed it
+            grid[last_obstacle] = free
+            continue
+        break
+
+    for y in range(size):
+        yield grid[y * size:(y + 1) * size].decode()
+
+
+@generator(7)
+def generate_equations(size: int, rng: random.Random) -> Iterator[str]:
+    """Equations of 2 to 12 operands; about two thirds have a test value reachable with +, * and ||"""
+    for _ in range(size):
+        operands = [rng.randint(1, 999) for _ in range(rng.randint(2, 12))]
+        if rng.random() < 0.67:
+            value = operands[0]
+            for operand in operands[1:]:
+                operator = rng.randrange(3)
+                if operator == 0:
+                    value += operand
+                elif operator == 1:
+                    value *= operand
+                else:
+                    value = int(f"{value}{operand}")
+        else:
+            value = rng.randint(1, 10 ** rng.randint(3, 15))
+        yield f"{value}: {' '.join(map(str, operands))}"
+
+
+@generator(8)
+def generate_antenna_map(size: int, rng: random.Random) -> Iterator[str]:
+    """Square grid with about one antenna per 16 cells, spread over all 62 frequencies"""
+    frequencies = string.digits + string.ascii_letters
+    for _ in range(size):
+        yield "".join(rng.choice(frequencies) if rng.random() < 1 / 16 else "." for _ in range(size))
+
+
+@generator(9)
+def generate_disk_map(size: int, rng: random.Random) -> Iterator[str]:
+    """Disk map of an odd number of digits: files of 1 to 9 blocks alternating with free spaces of 0 to 9 blocks"""
+    size += 1 - size % 2
+    yield "".join(str(rng.randint(1, 9)) if i % 2 == 0 else str(rng.randint(0, 9)) for i in range(size))
+
+
+@generator(10)
+def generate_topographic_map(size: int, rng: random.Random) -> Iterator[str]:
+    """Square grid of heights rising diagonally in bands of ten, with 20% noise, so there are many hiking trails"""
+    for y in range(size):
+        yield "".join(str(rng.randrange(10)) if rng.random() < 0.2 else str((x + y) % 10) for x in range(size))
+
+
+@generator(11)
+def generate_stones(size: int, rng: random.Random) -> Iterator[str]:
+    """Stones engraved with numbers of up to seven digits"""
+    yield " ".join(str(rng.randint(0, 10 ** rng.randint(1, 7))) for _ in range(size))
+
+
+def generate(day: int, size: int, seed: int = 0, output_dir: str = DEFAULT_GENERATED_DIR) -> str:
+    """Write the generated input of a day to a file (unless it already exists) and return its path"""
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, f"input_{day}_{size}_{seed}.txt")
+    if not os.path.exists(path):
+        rng = random.Random(f"{day}:{size}:{seed}")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            for line in GENERATORS[day](size, rng):
+                f.write(line)
+                f.write("\n")
+        os.replace(tmp_path, path)
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate large puzzle inputs")
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS), help="Day to generate an input for")
+    parser.add_argument("size", type=int, help="Size of the input, its meaning depends on the day")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random number generator")
+    parser.add_argument("--output-dir", type=str, default=DEFAULT_GENERATED_DIR,
+                        help="Directory the generated inputs are written to")
+    args = parser.parse_args()
+    print(generate(args.day, args.size, args.seed, args.output_dir))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+from typing import Iterable, Iterator, Optional, Union
+
+from solution_base import GridBuffer, InputSource
+
+BORDER = 0  # Sentinel byte of the padding, never part of a puzzle input
+
+
+class Grid:
+    """
+    Mutable 2D grid of single-byte cells, stored row by row in one flat bytearray.
+
+    Cells are addressed by integer indices instead of (x, y) tuples. The grid is surrounded by a border of
+    sentinel cells, so a step to a neighbour is a constant offset and always lands on a sentinel before it
+    could leave the grid: `grid[index + grid.up] == BORDER` replaces the bounds check.
+    """
+
+    def __init__(self, cells: bytearray, width: int, height: int, padding: int = 1, border: int = BORDER):
+        self.cells = cells
+        self.width = width
+        self.height = height
+        self.padding = padding
+        self.border = border
+        self.stride = width + 2 * padding
+
+        # Neighbour offsets, directions clockwise starting up
+        self.up = -self.stride
+        self.right = 1
+        self.down = self.stride
+        self.left = -1
+        self.directions = (self.up, self.right, self.down, self.left)
+        self.diagonals = (self.up + self.left, self.up + self.right, self.down + self.right, self.down + self.left)
+        self.neighbours = self.directions + self.diagonals
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Union[bytes, memoryview, str]], padding: int = 1,
+                  border: int = BORDER) -> 'Grid':
+        rows = [row.encode() if isinstance(row, str) else row for row in rows]
+        width = len(rows[0]) if rows else 0
+        pad = bytes([border]) * padding
+        border_rows = pad * ((width + 2 * padding) * padding)
+        cells = bytearray(border_rows + pad + (pad + pad).join(rows) + pad + border_rows)
+        return cls(cells, width, len(rows), padding, border)
+
+    @classmethod
+    def from_buffer(cls, buffer: GridBuffer, padding: int = 1, border: int = BORDER) -> 'Grid':
+        return cls.from_rows([buffer.row(y) for y in range(buffer.height)], padding, border)
+
+    @classmethod
+    def from_input(cls, input_data: InputSource, padding: int = 1, border: int = BORDER) -> 'Grid':
+        with input_data.read_grid_buffer() as buffer:
+            return cls.from_buffer(buffer, padding, border)
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.cells[index] = value
+
+    def __str__(self) -> str:
+        return "\n".join(self.row(y).decode() for y in range(self.height))
+
+    def index(self, x: int, y: int) -> int:
+        """Index of the cell (x, y)"""
+        return (y + self.padding) * self.stride + x + self.padding
+
+    def coord(self, index: int) -> tuple[int, int]:
+        """Cell (x, y) of an index"""
+        y, x = divmod(index, self.stride)
+        return x - self.padding, y - self.padding
+
+    def contains(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def row(self, y: int) -> bytearray:
+        start = self.index(0, y)
+        return self.cells[start:start + self.width]
+
+    def indices(self) -> Iterator[int]:
+        """Indices of all cells inside the border, row by row"""
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def find(self, value: bytes, start: int = 0) -> Optional[int]:
+        """Index of the first occurrence of value at or after index start, None if there is none"""
+        index = self.cells.find(value, start)
+        return None if index == -1 else index
+
+    def find_all(self, value: bytes) -> Iterator[int]:
+        index = self.cells.find(value)
+        while index != -1:
+            yield index
+            index = self.cells.find(value, index + 1)
+
+    def count(self, value: bytes) -> int:
+        """Number of non-overlapping occurrences of value, found by a single scan of the cells"""
+        return self.cells.count(value)
+
+    def values(self) -> set[int]:
+        """Distinct cell values inside the border"""
+        return set(self.cells.translate(None, bytes([self.border])))
+
+    def copy(self) -> 'Grid':
+        return Grid(self.cells.copy(), self.width, self.height, self.padding, self.border)
@@ -0,0 +1,135 @@
+import hashlib
+import json
+import os
+import platform
+import subprocess
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+import stats
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_HISTORY_PATH = os.path.join(BASE_DIR, "benchmark_history.jsonl")
+
+BenchmarkRecord = Dict[str, Any]
+
+
+def git_commit() -> Optional[str]:
+    """Current commit hash, suffixed with '-dirty' if there are uncommitted changes, None outside a git checkout"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=BASE_DIR, capture_output=True, text=True,
+                                check=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=BASE_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}-dirty" if status else commit
+
+
+def cpu_model() -> str:
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def machine_info() -> Dict[str, Any]:
+    """Description of the machine and interpreter the benchmark runs on"""
+    return {
+        "node": platform.node(),
+        "system": f"{platform.system()} {platform.release()}",
+        "machine": platform.machine(),
+        "cpu": cpu_model(),
+        "cpu_count": os.cpu_count(),
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+    }
+
+
+def machine_fingerprint(info: Optional[Dict[str, Any]] = None) -> str:
+    """Short hash of the machine info; timings are only comparable between runs with the same fingerprint"""
+    info = info or machine_info()
+    key = "|".join(str(info[field]) for field in ("node", "machine", "cpu", "cpu_count", "python"))
+    return hashlib.sha1(key.encode()).hexdigest()[:12]
+
+
+@dataclass
+class Regression:
+    day: int
+    part: int
+    message: str
+
+
+class BenchmarkHistory:
+    """Append-only JSONL store of benchmark results, one record per day and part"""
+
+    MIN_SLOWDOWN = 0.10  # Relative slowdown below which a significant difference is not reported
+    MEMORY_TOLERANCE = 0.10  # Relative growth of peak memory that is tolerated
+    MIN_MEMORY_GROWTH = 0.1  # MB, absolute growth below which memory is not reported
+
+    def __init__(self, path: str = DEFAULT_HISTORY_PATH):
+        self.path = path
+        self.commit = git_commit()
+        self.machine = machine_info()
+        self.fingerprint = machine_fingerprint(self.machine)
+        self.run_id = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+    def records(self) -> Iterator[BenchmarkRecord]:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def append(self, day: int, part: int, result: Dict[str, Any]) -> BenchmarkRecord:
+        record = {
+            "run_id": self.run_id,
+            "commit": self.commit,
+            "machine": self.fingerprint,
+            "day": day,
+            "part": part,
+            **result,
+        }
+        with open(self.path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+        return record
+
+    def baseline(self, day: int, part: int, commit: Optional[str] = None) -> Optional[BenchmarkRecord]:
+        """
+        Most recent successful record of a previous run on this machine for the given day and part.
+        If commit is given, only records of commits starting with it are considered.
+        """
+        baseline = None
+        for record in self.records():
+            if (record["day"] != day or record["part"] != part or record["machine"] != self.fingerprint
+                    or record["run_id"] == self.run_id or record.get("error") or not record.get("times")):
+                continue
+            if commit and not (record["commit"] or "").startswith(commit):
+                continue
+            baseline = record
+        return baseline
+
+    def compare(self, day: int, part: int, current: Dict[str, Any], baseline: BenchmarkRecord) -> List[Regression]:
+        """Regressions of the current result against the baseline: significant slowdowns and memory growth"""
+        regressions = []
+
+        times, baseline_times = current["times"], baseline["times"]
+        ratio = stats.mean(times) / stats.mean(baseline_times) if stats.mean(baseline_times) else 1
+        if ratio > 1 + self.MIN_SLOWDOWN and stats.is_significantly_greater(times, baseline_times):
+            regressions.append(Regression(day, part, f"time +{ratio - 1:.0%} "
+                                                     f"({stats.mean(baseline_times) * 1000:.2f}ms -> "
+                                                     f"{stats.mean(times) * 1000:.2f}ms, "
+                                                     f"baseline {(baseline['commit'] or 'unknown')[:10]})"))
+
+        memory, baseline_memory = max(current["memory"], default=0), max(baseline["memory"], default=0)
+        if (memory > baseline_memory * (1 + self.MEMORY_TOLERANCE)
+                and memory - baseline_memory > self.MIN_MEMORY_GROWTH):
+            regressions.append(Regression(day, part, f"memory {baseline_memory:.1f}MB -> {memory:.1f}MB "
+                                                     f"(baseline {(baseline['commit'] or 'unknown')[:10]})"))
+
+        return regressions
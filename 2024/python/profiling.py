@@ -0,0 +1,96 @@
+import cProfile
+import io
+import os
+import pstats
+import signal
+from collections import Counter
+from types import FrameType
+from typing import Optional
+
+from solution_base import AocSolution, bold
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PROFILE_DIR = os.path.join(BASE_DIR, "profiles")
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler that records the main thread's stack on every SIGPROF tick.
+    The samples are written in the collapsed-stack format understood by flamegraph.pl and speedscope.
+    Only available on platforms with signal.setitimer (not on Windows).
+    """
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._previous_handler = None
+
+    @staticmethod
+    def is_supported() -> bool:
+        return hasattr(signal, "setitimer") and hasattr(signal, "SIGPROF")
+
+    def _sample(self, signum: int, frame: Optional[FrameType]) -> None:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+            frame = frame.f_back
+        self.samples[";".join(reversed(stack))] += 1
+
+    def __enter__(self) -> 'SamplingProfiler':
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler)
+
+    def hottest(self, top: int = 10) -> list[tuple[str, int]]:
+        """Functions with the most samples at the top of the stack (self time)"""
+        leaves = Counter()
+        for stack, count in self.samples.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return leaves.most_common(top)
+
+    def write_collapsed(self, path: str) -> None:
+        with open(path, "w") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+def profile_part(solution: AocSolution, part: int, output_dir: str = DEFAULT_PROFILE_DIR, top: int = 20,
+                 interval: float = 0.001) -> None:
+    """
+    Profile one part twice: under cProfile for exact call counts (written as .pstats) and under the sampling
+    profiler for a flamegraph (written as collapsed stacks to .folded). Prints the top functions of both.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    solution.progress_verbose = False
+    name = f"day_{solution.day}_part_{part}"
+    print(bold(f"\nProfiling Day {solution.day:02d} Part {part} - {solution.title}"))
+
+    profiler = cProfile.Profile()
+    profiler.runcall(solution.solve, part)
+    pstats_path = os.path.join(output_dir, f"{name}.pstats")
+    profiler.dump_stats(pstats_path)
+
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).strip_dirs().sort_stats(pstats.SortKey.TIME).print_stats(top)
+    print(stream.getvalue().strip())
+    print(f"cProfile stats written to {pstats_path}")
+
+    if not SamplingProfiler.is_supported():
+        print("Sampling profiler not supported on this platform, skipping flamegraph")
+        return
+
+    with SamplingProfiler(interval) as sampler:
+        solution.solve(part)
+    folded_path = os.path.join(output_dir, f"{name}.folded")
+    sampler.write_collapsed(folded_path)
+
+    total = sum(sampler.samples.values())
+    print(bold(f"\nHottest functions by samples ({total} samples, {interval * 1000:g}ms interval):"))
+    for function, count in sampler.hottest(top):
+        print(f"  {count / total:6.1%}  {function}")
+    print(f"Collapsed stacks written to {folded_path}")
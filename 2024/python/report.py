@@ -0,0 +1,76 @@
+import csv
+import json
+from typing import Any, Dict, List, TextIO
+
+import stats
+from history import git_commit, machine_info
+
+FORMATS = ["text", "json", "csv"]
+
+ReportEntry = Dict[str, Any]  # day, title, part and the raw samples of BenchmarkResult.to_dict()
+
+
+def summarize(entry: ReportEntry) -> Dict[str, Any]:
+    times = entry["times"]
+    ci_low, ci_high = stats.confidence_interval(times) if len(times) > 1 else (None, None)
+    return {
+        "runs": len(times),
+        "mean": stats.mean(times),
+        "median": stats.median(times),
+        "p95": stats.percentile(times, 95),
+        "stddev": stats.stddev(times),
+        "ci95_low": ci_low,
+        "ci95_high": ci_high,
+        "min": min(times, default=0),
+        "mean_parse": stats.mean(entry["parse_times"]),
+        "peak_memory_mb": max(entry["memory"], default=0),
+    }
+
+
+def write_json(entries: List[ReportEntry], stream: TextIO) -> None:
+    report = {
+        "commit": git_commit(),
+        "machine": machine_info(),
+        "results": [{**entry, "summary": summarize(entry)} for entry in entries],
+    }
+    json.dump(report, stream, indent=2)
+    stream.write("\n")
+
+
+def write_csv(entries: List[ReportEntry], stream: TextIO) -> None:
+    """One row per sample in long format, so every raw sample survives the export"""
+    machine = machine_info()
+    commit = git_commit()
+    writer = csv.writer(stream)
+    writer.writerow(["day", "part", "metric", "run", "value", "error", "commit", "python", "cpu"])
+    context = [commit, machine["python"], machine["cpu"]]
+
+    for entry in entries:
+        if entry["error"]:
+            writer.writerow([entry["day"], entry["part"], "error", "", "", entry["error"], *context])
+        for metric, samples in (("time_s", entry["times"]), ("parse_s", entry["parse_times"]),
+                                ("warmup_s", entry["warmup_times"]), ("peak_memory_mb", entry["memory"])):
+            for run, value in enumerate(samples):
+                writer.writerow([entry["day"], entry["part"], metric, run, value, "", *context])
+
+
+def write_text(entries: List[ReportEntry], stream: TextIO) -> None:
+    """Plain-text summary without colors, for files and logs"""
+    machine = machine_info()
+    stream.write(f"Advent of Code 2024 Benchmark ({machine['python']}, {machine['cpu']}, "
+                 f"{machine['cpu_count']} CPUs, commit {git_commit()})\n")
+
+    for entry in entries:
+        prefix = f"Day {entry['day']:02d} Part {entry['part']}"
+        if entry["error"]:
+            stream.write(f"{prefix}: error: {entry['error']}\n")
+            continue
+        summary = summarize(entry)
+        stream.write(f"{prefix}: mean {summary['mean'] * 1000:.3f}ms, median {summary['median'] * 1000:.3f}ms, "
+                     f"p95 {summary['p95'] * 1000:.3f}ms, stddev {summary['stddev'] * 1000:.3f}ms, "
+                     f"n={summary['runs']}, peak memory {summary['peak_memory_mb']:.2f}MB\n")
+
+
+def write_report(report_format: str, entries: List[ReportEntry], stream: TextIO) -> None:
+    writers = {"text": write_text, "json": write_json, "csv": write_csv}
+    writers[report_format](entries, stream)
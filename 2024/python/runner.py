@@ -1,26 +1,78 @@
 import argparse
+import gc
 import importlib
 import logging
+import math
+import multiprocessing
 import os
+import signal
 import sys
 import time
 import traceback
 import tracemalloc
-from typing import List, Type, Optional, Set, Tuple, Dict
-
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, List, Type, Optional, Set, Tuple, Dict
+
+try:
+    import resource
+except ImportError:  # Not available on Windows, memory limits are not enforced there
+    resource = None
+
+import generators
+from history import BenchmarkHistory, Regression
+import profiling
+import report
 from solution_base import (AocSolution, bold, CustomFormatter,
-                           InputSource, ProgressStatus)
+                           InputSource, ProgressStatus, Result)
+import stats
 
 
 class BenchmarkResult:
-    def __init__(self, times: List[float], memory: List[float], error: Optional[str] = None):
-        self.times = times
-        self.memory = memory
+    def __init__(self, times: List[float], memory: List[float], error: Optional[str] = None,
+                 parse_times: Optional[List[float]] = None, warmup_times: Optional[List[float]] = None):
+        self.times = times  # Time-only samples, measured without tracemalloc
+        self.memory = memory  # Peak memory of the separate memory-only runs
         self.error = error
+        self.parse_times = parse_times if parse_times is not None else []
+        self.warmup_times = warmup_times if warmup_times is not None else []
+
+    @property
+    def runs(self) -> int:
+        return len(self.times)
 
     @property
     def avg_time(self) -> float:
-        return sum(self.times) / len(self.times) if self.times else 0
+        return stats.mean(self.times)
+
+    @property
+    def median_time(self) -> float:
+        return stats.median(self.times)
+
+    @property
+    def p95_time(self) -> float:
+        return stats.percentile(self.times, 95)
+
+    @property
+    def stddev_time(self) -> float:
+        return stats.stddev(self.times)
+
+    @property
+    def ci_time(self) -> Tuple[float, float]:
+        """95% confidence interval of the mean time"""
+        return stats.confidence_interval(self.times)
+
+    @property
+    def relative_error(self) -> float:
+        return stats.relative_error(self.times)
+
+    @property
+    def avg_parse_time(self) -> float:
+        return stats.mean(self.parse_times)
+
+    @property
+    def avg_solve_time(self) -> float:
+        return self.avg_time - self.avg_parse_time
 
     @property
     def min_time(self) -> float:
@@ -34,120 +86,356 @@ class BenchmarkResult:
     def peak_memory(self) -> float:
         return max(self.memory) if self.memory else 0
 
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "times": self.times,
+            "memory": self.memory,
+            "parse_times": self.parse_times,
+            "warmup_times": self.warmup_times,
+            "error": self.error,
+        }
+
+
+@dataclass
+class BenchmarkConfig:
+    max_runs: int = 100  # Upper bound of timed runs per part
+    min_runs: int = 5  # Timed runs before the target error may stop sampling
+    warmup_runs: int = 1  # Untimed runs before sampling (input cache, imports, CPU caches)
+    memory_runs: int = 1  # Runs under tracemalloc, kept apart from the timed runs
+    target_error: float = 0.02  # Stop once the 95% CI half width is within this fraction of the mean
+    max_time: float = 10.0  # Seconds of timed sampling per part after which the error target is given up
+
+
+def expected_timed_runs(result: BenchmarkResult, config: BenchmarkConfig, elapsed: float) -> int:
+    """
+    Estimate how many timed runs adaptive sampling will take, for the progress total: the CI half width
+    shrinks with the square root of the runs, and the time budget caps the runs at the current pace.
+    """
+    runs = result.runs
+    needed = config.max_runs
+    error = result.relative_error if runs >= 2 else math.inf
+    if math.isfinite(error):
+        needed = math.ceil(runs * (error / config.target_error) ** 2) if config.target_error > 0 else config.max_runs
+    if runs and elapsed > 0:
+        needed = min(needed, math.ceil(config.max_time / (elapsed / runs)))
+    return max(runs, min(config.max_runs, max(config.min_runs, needed)))
+
+
+@dataclass
+class RunLimits:
+    timeout: Optional[float] = None  # Wall-clock seconds a single run of a part may take
+    memory_limit: Optional[int] = None  # MB of address space available to the process running a part
+
+    @property
+    def enabled(self) -> bool:
+        return self.timeout is not None or self.memory_limit is not None
+
+
+def format_duration(seconds: float) -> str:
+    return f"{seconds * 1000:6.1f}ms" if seconds < 1 else f"{seconds:6.1f}s"
+
+
+PartOutcome = Tuple[Optional[Result], Optional[Tuple[str, str]]]  # (result, (error_type, error_msg))
+
+
+def format_exception(e: Exception) -> Tuple[str, str]:
+    """Describe an exception as ('<Type> at line <n>', message) using the innermost traceback frame"""
+    tb = traceback.extract_tb(e.__traceback__)
+    error_line = tb[-1].lineno if tb else '?'
+    return f"{type(e).__name__} at line {error_line}", str(e)
+
+
+def _solve_part_job(solution_class: Type[AocSolution], part: int, input_path: Optional[str] = None) -> PartOutcome:
+    """Solve a single part inside a worker process.
+    Exceptions are returned as text because they are not guaranteed to be picklable."""
+    solution = solution_class()
+    solution.progress_verbose = False
+    try:
+        return solution.solve(part, input_path=input_path), None
+    except MemoryError as e:
+        return None, ("OOM", format_exception(e)[0])
+    except Exception as e:
+        return None, format_exception(e)
+
+
+def _benchmark_part_job(solution_class: Type[AocSolution], part: int, config: BenchmarkConfig,
+                        show_progress: bool = False,
+                        heartbeat: Optional[Callable[[], None]] = None) -> BenchmarkResult:
+    """Benchmark a single part inside a worker process"""
+    return AocRunner().benchmark_part(solution_class(), part, config, show_progress, heartbeat)
+
+
+def _limited_child(conn, job: Callable, args: tuple, memory_limit: Optional[int], heartbeat: bool) -> None:
+    """Entry point of the child process of run_limited: apply the memory limit, run the job and send its outcome"""
+    if hasattr(os, "setsid"):
+        # Lead a new process group, so a timeout also stops worker processes the solver started
+        os.setsid()
+    if memory_limit is not None and resource is not None:
+        limit = memory_limit * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    kwargs = {"heartbeat": lambda: conn.send(("alive", None))} if heartbeat else {}
+    try:
+        conn.send(("done", job(*args, **kwargs)))
+    except MemoryError:
+        conn.send(("oom", None))
+    finally:
+        conn.close()
+
+
+def run_limited(job: Callable, args: tuple, limits: RunLimits, heartbeat: bool = False) -> Tuple[str, object]:
+    """
+    Run job(*args) in a child process under the given limits and return (status, payload):
+    ("done", outcome), ("timeout", None), ("oom", None) or ("crash", exit code).
+    With heartbeat, the job receives a heartbeat callback and the timeout restarts whenever it is called,
+    so the timeout applies to every single run of a benchmark instead of the benchmark as a whole.
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_limited_child,
+                                      args=(sender, job, args, limits.memory_limit, heartbeat))
+    process.start()
+    sender.close()
+    try:
+        while True:
+            if not receiver.poll(limits.timeout):
+                return "timeout", None
+            try:
+                status, payload = receiver.recv()
+            except EOFError:
+                # The child died without reporting, e.g. killed by the kernel's OOM killer or a signal
+                process.join()
+                if limits.memory_limit is not None and process.exitcode == -9:
+                    return "oom", None
+                return "crash", process.exitcode
+            if status != "alive":
+                return status, payload
+    finally:
+        _kill_process_group(process)
+        process.join()
+        receiver.close()
+
+
+def _kill_process_group(process: multiprocessing.Process) -> None:
+    """Kill a run_limited child together with any processes it started, e.g. a solver's worker pool"""
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass  # The child has not created its group yet, or the group is gone already
+    if process.is_alive():
+        process.kill()
+
+
+def describe_limit_violation(status: str, payload: object, limits: RunLimits) -> Tuple[str, str]:
+    """Describe a failed run_limited status as (error_type, error_msg)"""
+    if status == "timeout":
+        return "TIMEOUT", f"No result within {limits.timeout:g}s"
+    if status == "oom":
+        return "OOM", f"Exceeded the memory limit of {limits.memory_limit}MB"
+    return "CRASH", f"Process exited with code {payload}"
+
+
+def solve_part_limited(solution_class: Type[AocSolution], part: int, limits: RunLimits,
+                       input_path: Optional[str] = None) -> PartOutcome:
+    """Solve a single part in a child process under the given limits"""
+    status, payload = run_limited(_solve_part_job, (solution_class, part, input_path), limits)
+    if status == "done":
+        return payload
+    return None, describe_limit_violation(status, payload, limits)
+
+
+def benchmark_part_limited(solution_class: Type[AocSolution], part: int, config: BenchmarkConfig,
+                           limits: RunLimits, show_progress: bool = False) -> BenchmarkResult:
+    """Benchmark a single part in a child process, every run of it under the given limits"""
+    status, payload = run_limited(_benchmark_part_job, (solution_class, part, config, show_progress), limits,
+                                  heartbeat=True)
+    if status == "done":
+        return payload
+    if show_progress:
+        # Clear the progress line the stopped child left behind
+        sys.stdout.write("\r\033[K")
+    error_type, error_msg = describe_limit_violation(status, payload, limits)
+    return BenchmarkResult([], [], f"{error_type}: {error_msg}")
+
 
 class AocRunner:
     SLOW_THRESHOLD = 10.0  # seconds
-    MIN_RUNS_FOR_SLOW = 2  # minimum runs for slow solutions
+    _module_index: Optional[Dict[int, str]] = None  # Day number -> module name, shared by all runners
 
     def __init__(self):
         self.logger = logging.getLogger("AOC_Runner")
-        self.logger.addHandler(CustomFormatter.get_console_handler())
+        if not self.logger.handlers:
+            self.logger.addHandler(CustomFormatter.get_console_handler())
         self.logger.setLevel(logging.INFO)
+        self.history: Optional[BenchmarkHistory] = None
+        self.record_history = False
+        self.compare = False
+        self.baseline_commit: Optional[str] = None
+        self.regressions: List[Regression] = []
+        self.report_format: Optional[str] = None  # None: colored console output unless a report file is given
+        self.report_path: Optional[str] = None
+        self.report_entries: List[report.ReportEntry] = []
+        self.limits = RunLimits()
+
+    def set_report(self, report_format: Optional[str] = None, path: Optional[str] = None) -> None:
+        """
+        Write benchmark results as text/json/csv to a file (or stdout) instead of the colored console output.
+        Without a format the console output is kept, unless a file is given, which then gets a plain text report.
+        """
+        self.report_format = report_format
+        self.report_path = path
 
-    def discover_solutions(self) -> List[Type[AocSolution]]:
-        """Discover all day solution classes in the current directory"""
-        solutions = []
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-
-        for filename in os.listdir(current_dir):
-            if filename.startswith("day_") and filename.endswith(".py"):
-                try:
-                    day_number = int(filename.removeprefix("day_").removesuffix(".py"))
-                    module_name = filename[:-3]
-                    module = importlib.import_module(module_name)
-
-                    for item_name in dir(module):
-                        if item_name.startswith("Day"):
-                            day_class = getattr(module, item_name)
-                            if (issubclass(day_class, AocSolution) and
-                                    day_class != AocSolution):
-                                solutions.append((day_number, day_class))
-                                break
-                except Exception as e:
-                    self.logger.error(f"Error loading {filename}: {e}")
-
-        return [cls for _, cls in sorted(solutions, key=lambda x: x[0])]
+    @property
+    def console_output(self) -> bool:
+        return self.report_format is None and self.report_path is None
 
-    def run_single_benchmark(self, solution: AocSolution, part: int) -> Tuple[float, float]:
-        """Run a single benchmark iteration and return (time, memory)"""
+    def _notify(self, message: str, color: str) -> None:
+        """Print a message on the console, or uncolored to stderr while a report is written"""
+        if self.console_output:
+            print(f"{color}{message}{CustomFormatter.reset}")
+        else:
+            print(message.strip(), file=sys.stderr)
+
+    def set_limits(self, timeout: Optional[float] = None, memory_limit: Optional[int] = None) -> None:
+        """Run every part in a child process that is stopped after timeout seconds or memory_limit MB"""
+        if memory_limit is not None and resource is None:
+            self.logger.warning("Memory limits are not supported on this platform and will be ignored")
+        self.limits = RunLimits(timeout, memory_limit)
+
+    def track_history(self, history: BenchmarkHistory, record: bool = True, compare: bool = False,
+                      baseline_commit: Optional[str] = None) -> None:
+        """Append benchmark results to the history and/or compare them against a stored baseline"""
+        self.history = history
+        self.record_history = record
+        self.compare = compare
+        self.baseline_commit = baseline_commit
+
+    @classmethod
+    def module_index(cls) -> Dict[int, str]:
+        """Map day numbers to module names from the day_<n>.py filenames, without importing anything"""
+        if cls._module_index is None:
+            index = {}
+            current_dir = os.path.dirname(os.path.abspath(__file__))
+            for filename in os.listdir(current_dir):
+                if filename.startswith("day_") and filename.endswith(".py"):
+                    try:
+                        index[int(filename.removeprefix("day_").removesuffix(".py"))] = filename[:-3]
+                    except ValueError:
+                        continue
+            cls._module_index = dict(sorted(index.items()))
+        return cls._module_index
+
+    def load_solution(self, day: int) -> Optional[Type[AocSolution]]:
+        """Import the module of a single day and return its solution class"""
+        module_name = self.module_index()[day]
+        try:
+            module = importlib.import_module(module_name)
+        except Exception as e:
+            self.logger.error(f"Error loading {module_name}.py: {e}")
+            return None
+
+        for item_name in dir(module):
+            if item_name.startswith("Day"):
+                day_class = getattr(module, item_name)
+                if isinstance(day_class, type) and issubclass(day_class, AocSolution) and day_class != AocSolution:
+                    return day_class
+
+        self.logger.error(f"No solution class found in {module_name}.py")
+        return None
+
+    def discover_solutions(self, days: Optional[Set[int]] = None,
+                           skip_days: Optional[Set[int]] = None) -> List[Type[AocSolution]]:
+        """Load the solution classes of the selected days in day order, importing only their modules"""
+        selected_days = [day for day in self.module_index()
+                         if (days is None or day in days) and not (skip_days and day in skip_days)]
+        solutions = [self.load_solution(day) for day in selected_days]
+        return [solution for solution in solutions if solution is not None]
+
+    @staticmethod
+    def run_timed(solution: AocSolution, part: int) -> Result:
+        """Run a single iteration for timing only, starting from a collected heap"""
+        gc.collect()
+        return solution.solve(part)
+
+    @staticmethod
+    def run_memory(solution: AocSolution, part: int) -> float:
+        """Run a single iteration under tracemalloc and return its peak memory in MB"""
+        gc.collect()
         tracemalloc.start()
-        start = time.perf_counter()
-
         try:
-            if part == 1:
-                solution.solve_part1(InputSource(solution.day, 1, False))
-            else:
-                solution.solve_part2(InputSource(solution.day, 2, False))
-
-            execution_time = time.perf_counter() - start
+            solution.solve(part)
             _, peak = tracemalloc.get_traced_memory()
-            return execution_time, peak / 1024 / 1024  # Convert to MB
+            return peak / 1024 / 1024
         finally:
             tracemalloc.stop()
 
-    def benchmark_solution(self, solution: AocSolution, max_runs: int = 10) -> Dict[str, BenchmarkResult]:
-        """Benchmark a solution with adaptive runs for slow solutions"""
-        results = {
-            "part1": BenchmarkResult([], []),
-            "part2": BenchmarkResult([], [])
-        }
+    def benchmark_part(self, solution: AocSolution, part: int, config: BenchmarkConfig = None,
+                       show_progress: bool = True,
+                       heartbeat: Optional[Callable[[], None]] = None) -> BenchmarkResult:
+        """
+        Benchmark a single part in three phases: warm-up runs, timed runs and memory runs.
+        Timed runs continue until the confidence interval of the mean is within the target relative error,
+        or until the run or time budget of the config is exhausted.
+        The optional heartbeat is called after every run.
+        """
+        config = config or BenchmarkConfig()
+        result = BenchmarkResult([], [])
+        heartbeat = heartbeat or (lambda: None)
 
         solution.progress_verbose = False
-        progress_desc = f"Benchmark Day {solution.day:02d}"
-
-        for part in [1, 2]:
-            # First create a progress bar with just one step to show the first run
-            progress = ProgressStatus(1,
-                                      desc=progress_desc,
-                                      show_count=False)
-            try:
-                progress.update(0, part=part, current_run=0)
-                # First run to check execution time
-                execution_time, memory = self.run_single_benchmark(solution, part)
-                results[f"part{part}"].times.append(execution_time)
-                results[f"part{part}"].memory.append(memory)
-
-                # Determine number of runs based on execution time
-                remaining_runs = (AocRunner.MIN_RUNS_FOR_SLOW if execution_time > AocRunner.SLOW_THRESHOLD
-                                  else max_runs - 1)
-
-                if execution_time > AocRunner.SLOW_THRESHOLD:
-                    # Update progress for slow solution
-                    progress = ProgressStatus(
-                        AocRunner.MIN_RUNS_FOR_SLOW,
-                        desc=progress_desc,
-                        show_count=False
-                    )
-                    progress.update(1, part=part, current_run=1,
-                                    status=f"Slow solution ({execution_time:.1f}s), reducing to {remaining_runs + 1} runs")
-                else:
-                    # Update progress for normal solution
-                    progress = ProgressStatus(
-                        max_runs,
-                        desc=progress_desc,
-                        show_count=False
-                    )
-                    progress.update(1, part=part, current_run=1)
-
-                # Remaining runs
-                for run in range(remaining_runs):
-                    execution_time, memory = self.run_single_benchmark(solution, part)
-                    results[f"part{part}"].times.append(execution_time)
-                    results[f"part{part}"].memory.append(memory)
-                    progress.update(1, current_run=run + 2)
-
-            except Exception as e:
-                tb = traceback.extract_tb(sys.exc_info()[2])
-                error_line = tb[-1].lineno
-                error_type = type(e).__name__
-                error_msg = f"{error_type} at line {error_line}: {str(e)}"
-                results[f"part{part}"].error = error_msg
-            finally:
-                progress.finish()
+        progress = ProgressStatus(config.warmup_runs + config.max_runs + config.memory_runs,
+                                  desc=f"Benchmark Day {solution.day:02d}",
+                                  show_count=False,
+                                  verbose=show_progress)
+        try:
+            for _ in range(config.warmup_runs):
+                progress.update(1, part=part, phase='warm-up')
+                result.warmup_times.append(self.run_timed(solution, part).execution_time)
+                heartbeat()
+
+            sampling_start = time.perf_counter()
+            while result.runs < config.max_runs:
+                run_result = self.run_timed(solution, part)
+                result.times.append(run_result.execution_time)
+                result.parse_times.append(run_result.parse_time)
+                heartbeat()
+
+                elapsed = time.perf_counter() - sampling_start
+                converged = result.runs >= config.min_runs and result.relative_error <= config.target_error
+                stopping = converged or elapsed > config.max_time
+                # Sampling usually stops well before max_runs, so the total follows the expected number of runs
+                timed_runs = result.runs if stopping else expected_timed_runs(result, config, elapsed)
+                progress.total = config.warmup_runs + timed_runs + config.memory_runs
+                progress.update(1, part=part, phase='timing', error=f"{result.relative_error:.1%}")
+
+                if stopping:
+                    break
+
+            for _ in range(config.memory_runs):
+                progress.update(1, part=part, phase='memory')
+                result.memory.append(self.run_memory(solution, part))
+                heartbeat()
+
+        except MemoryError as e:
+            result.error = f"OOM: {format_exception(e)[0]}"
+        except Exception as e:
+            error_type, error_msg = format_exception(e)
+            result.error = f"{error_type}: {error_msg}"
+        finally:
+            progress.finish()
+            if show_progress:
                 # Clear the progress line
                 sys.stdout.write("\033[F\033[K")
 
-        return results
+        return result
+
+    def benchmark_solution(self, solution: AocSolution, config: BenchmarkConfig = None,
+                           show_progress: bool = True) -> Dict[str, BenchmarkResult]:
+        """Benchmark both parts of a solution, each in a child process if limits are set"""
+        if self.limits.enabled:
+            return {f"part{part}": benchmark_part_limited(type(solution), part, config or BenchmarkConfig(),
+                                                          self.limits, show_progress)
+                    for part in [1, 2]}
+        return {f"part{part}": self.benchmark_part(solution, part, config, show_progress) for part in [1, 2]}
 
     def get_part_color(self, part_results: BenchmarkResult) -> str:
         """Determine color based on performance"""
@@ -174,59 +462,239 @@ class AocRunner:
             if part_results.error:
                 print(f"    {CustomFormatter.red}Error: {part_results.error}{CustomFormatter.reset}")
             else:
-                time_str = f"{part_results.avg_time * 1000:6.1f}ms" if part_results.avg_time < 1 else f"{part_results.avg_time:6.1f}s"
-                min_time_str = f"{part_results.min_time * 1000:6.1f}ms" if part_results.min_time < 1 else f"{part_results.min_time:6.1f}s"
-
-                print(f"    Time: {part_color}{time_str}{CustomFormatter.reset} " +
-                      f"(min: {min_time_str})")
+                ci_low, ci_high = part_results.ci_time
+                ci_str = (f"95% CI: {format_duration(ci_low).strip()} - {format_duration(ci_high).strip()}"
+                          if part_results.runs > 1 else "95% CI: n/a")
+                print(f"    Time: {part_color}{format_duration(part_results.avg_time)}{CustomFormatter.reset} " +
+                      f"({ci_str}, n={part_results.runs})")
+                print(f"    Dist: median {format_duration(part_results.median_time).strip()}, " +
+                      f"p95 {format_duration(part_results.p95_time).strip()}, " +
+                      f"min {format_duration(part_results.min_time).strip()}, " +
+                      f"stddev {format_duration(part_results.stddev_time).strip()}")
+                print(f"    Parse: {format_duration(part_results.avg_parse_time)} " +
+                      f"Solve: {format_duration(part_results.avg_solve_time)}")
                 print(f"    Mem:  {part_color}{part_results.peak_memory:6.1f}MB{CustomFormatter.reset} " +
                       f"(avg: {part_results.avg_memory:6.1f}MB)")
 
+    def print_part_outcome(self, part: int, outcome: PartOutcome, verbose: bool = True) -> None:
+        result, error = outcome
+        if error is None:
+            print(bold(f'Part {part}: ') + AocSolution.format_result(result))
+            return
+        error_type, error_msg = error
+        print(f"  {CustomFormatter.red}Part {part}: {error_type}{CustomFormatter.reset}")
+        if verbose:
+            print(f"  {CustomFormatter.red}{error_msg}{CustomFormatter.reset}")
+
+    def report_benchmark(self, solution: AocSolution, results: Dict[str, BenchmarkResult]) -> None:
+        """Print or collect benchmark results, compare them against the baseline and record them in the history"""
+        if self.console_output:
+            self.print_benchmark_results(solution, results)
+
+        for part in [1, 2]:
+            current = results[f"part{part}"].to_dict()
+            self.report_entries.append({"day": solution.day, "title": solution.title, "part": part, **current})
+
+            if self.history is None:
+                continue
+            if self.compare and not current["error"]:
+                baseline = self.history.baseline(solution.day, part, self.baseline_commit)
+                if baseline is None:
+                    self._notify(f"  Day {solution.day:02d} Part {part}: no baseline to compare against",
+                                 CustomFormatter.yellow)
+                else:
+                    regressions = self.history.compare(solution.day, part, current, baseline)
+                    for regression in regressions:
+                        self._notify(f"  Day {solution.day:02d} Part {part} regression: {regression.message}",
+                                     CustomFormatter.red)
+                    self.regressions.extend(regressions)
+            if self.record_history:
+                self.history.append(solution.day, part, current)
+
+        if self.console_output:
+            print()  # Add empty line between solutions
+
+    def write_report(self) -> None:
+        report_format = self.report_format or "text"
+        if self.report_path is None:
+            report.write_report(report_format, self.report_entries, sys.stdout)
+            return
+        with open(self.report_path, "w", newline="") as f:
+            report.write_report(report_format, self.report_entries, f)
+
     def run_solution(self, solution: AocSolution, verbose: bool = True) -> None:
         """Run a single solution with error handling"""
         print(f"\n{bold(f'Day {solution.day:02d} - {solution.title}')}")
         for part in [1, 2]:
+            if self.limits.enabled:
+                self.print_part_outcome(part, solve_part_limited(type(solution), part, self.limits), verbose)
+                continue
             try:
-                solution.execute_part(part, False, None, True, bold(f'Part {part}: '))
+                outcome = solution.solve(part), None
             except Exception as e:
-                tb = traceback.extract_tb(sys.exc_info()[2])
-                error_line = tb[-1].lineno
-                error_type = type(e).__name__
-                print(f"  {CustomFormatter.red}Part {part}: {error_type} at line {error_line}{CustomFormatter.reset}")
-                if verbose:
-                    print(f"  {CustomFormatter.red}{str(e)}{CustomFormatter.reset}")
+                outcome = None, format_exception(e)
+            self.print_part_outcome(part, outcome, verbose)
+
+    def run_parallel(self, solutions: List[Type[AocSolution]], jobs: int, benchmark: bool = False,
+                     benchmark_config: BenchmarkConfig = None, verbose: bool = True) -> None:
+        """Dispatch every (day, part) pair to a process pool.
+        Results are collected as they complete but printed in day order, so the output matches a sequential run."""
+        completed: Dict[Type[AocSolution], Dict[int, object]] = {}
+        next_idx = 0
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {}
+            for solution_class in solutions:
+                for part in [1, 2]:
+                    if benchmark and self.limits.enabled:
+                        future = executor.submit(benchmark_part_limited, solution_class, part, benchmark_config,
+                                                 self.limits)
+                    elif benchmark:
+                        future = executor.submit(_benchmark_part_job, solution_class, part, benchmark_config)
+                    elif self.limits.enabled:
+                        future = executor.submit(solve_part_limited, solution_class, part, self.limits)
+                    else:
+                        future = executor.submit(_solve_part_job, solution_class, part)
+                    futures[future] = (solution_class, part)
+
+            for future in as_completed(futures):
+                solution_class, part = futures[future]
+                try:
+                    outcome = future.result()
+                except Exception as e:
+                    # The worker itself died (e.g. BrokenProcessPool), not the solution
+                    error_type, error_msg = format_exception(e)
+                    outcome = (BenchmarkResult([], [], f"{error_type}: {error_msg}") if benchmark
+                               else (None, (error_type, error_msg)))
+                completed.setdefault(solution_class, {})[part] = outcome
+
+                # Flush every day whose parts are all done, without skipping ahead of a pending day
+                while next_idx < len(solutions) and len(completed.get(solutions[next_idx], {})) == 2:
+                    solution = solutions[next_idx]()
+                    outcomes = completed.pop(solutions[next_idx])
+                    if benchmark:
+                        self.report_benchmark(solution, {f"part{p}": outcomes[p] for p in [1, 2]})
+                    else:
+                        print(f"\n{bold(f'Day {solution.day:02d} - {solution.title}')}")
+                        for p in [1, 2]:
+                            self.print_part_outcome(p, outcomes[p], verbose)
+                    next_idx += 1
+
+    def time_scaled_run(self, solution_class: Type[AocSolution], part: int, input_path: str, repeat: int = 3,
+                        max_time: float = SLOW_THRESHOLD) -> Tuple[float, Optional[str]]:
+        """
+        Best time of up to repeat cold runs (input cache cleared) of a part on the given input and the error, if any.
+        Runs slower than max_time are not repeated.
+        """
+        best = float("inf")
+        for _ in range(repeat):
+            InputSource.clear_cache()
+            gc.collect()
+            if self.limits.enabled:
+                result, error = solve_part_limited(solution_class, part, self.limits, input_path)
+            else:
+                result, error = _solve_part_job(solution_class, part, input_path)
+            if error is not None:
+                error_type, error_msg = error
+                return best, f"{error_type}: {error_msg}"
+            best = min(best, result.execution_time)
+            if result.execution_time > max_time:
+                break
+        InputSource.clear_cache()
+        return best, None
+
+    def scale(self, days: Optional[Set[int]] = None, skip_days: Optional[Set[int]] = None,
+              sizes: Optional[List[int]] = None, seed: int = 0, max_time: float = SLOW_THRESHOLD) -> int:
+        """
+        Run every part on generated inputs of growing size and fit the empirical complexity exponent k
+        of time ~ size^k. A part stops climbing its size ladder once a run takes longer than max_time.
+        """
+        solutions = self.discover_solutions(days, skip_days)
+        if not solutions:
+            self.logger.error("No matching solutions found!")
+            return 1
+
+        print(bold("\n=== Advent of Code 2024 Scaling ==="))
+        for solution_class in solutions:
+            day = solution_class().day
+            if day not in generators.GENERATORS:
+                self.logger.warning(f"No input generator for day {day}, skipping")
+                continue
+            print(f"{bold(f'Day {day:02d}')} - {solution_class().title}")
+
+            for part in [1, 2]:
+                print(f"  Part {part}:")
+                samples = []
+                for size in sizes or generators.SIZE_LADDERS[day]:
+                    elapsed, error = self.time_scaled_run(solution_class, part, generators.generate(day, size, seed),
+                                                          max_time=max_time)
+                    if error is not None:
+                        print(f"    {CustomFormatter.red}n={size:<10} {error}{CustomFormatter.reset}")
+                        break
+                    samples.append((size, elapsed))
+                    print(f"    n={size:<10} {format_duration(elapsed)}")
+                    if elapsed > max_time:
+                        break
+
+                if len(samples) > 1:
+                    exponent, _ = stats.fit_power_law(*zip(*samples))
+                    print(f"    Empirical complexity: {bold(f'O(n^{exponent:.2f})')}")
+            print()
+        return 0
+
+    def profile(self, day: int, parts: List[int], output_dir: str = profiling.DEFAULT_PROFILE_DIR, top: int = 20,
+                interval: float = 0.001) -> int:
+        """Profile the given parts of a single day and return the exit status"""
+        if day not in self.module_index():
+            self.logger.error(f"No solution found for day {day}!")
+            return 1
+        solution_class = self.load_solution(day)
+        if solution_class is None:
+            return 1
+
+        solution = solution_class()
+        for part in parts:
+            profiling.profile_part(solution, part, output_dir, top, interval)
+        return 0
 
     def run(self, days: Optional[Set[int]] = None, skip_days: Optional[Set[int]] = None,
-            benchmark: bool = False, benchmark_runs: int = 10, verbose: bool = True) -> None:
-        """Run solutions with optional benchmarking"""
-        solutions = self.discover_solutions()
-
-        if not solutions:
+            benchmark: bool = False, benchmark_config: BenchmarkConfig = None, verbose: bool = True,
+            jobs: int = 1) -> int:
+        """Run solutions with optional benchmarking and return the exit status (1 if regressions were found)"""
+        if not self.module_index():
             self.logger.error("No solutions found!")
-            return
-
-        # Filter solutions based on days and skip_days
-        if days is not None:
-            solutions = [s for s in solutions if s().day in days]
-        if skip_days:
-            solutions = [s for s in solutions if s().day not in skip_days]
+            return 1
 
+        solutions = self.discover_solutions(days, skip_days)
         if not solutions:
             self.logger.error("No matching solutions found!")
-            return
+            return 1
 
         if benchmark:
-            print(bold("\n=== Advent of Code 2024 Benchmark ==="))
-            for solution_class in solutions:
-                solution = solution_class()
-                results = self.benchmark_solution(solution, benchmark_runs)
-                self.print_benchmark_results(solution, results)
-                print()  # Add empty line between solutions
+            if self.console_output:
+                print(bold("\n=== Advent of Code 2024 Benchmark ==="))
+            if jobs > 1:
+                self.run_parallel(solutions, jobs, benchmark=True, benchmark_config=benchmark_config)
+            else:
+                for solution_class in solutions:
+                    solution = solution_class()
+                    results = self.benchmark_solution(solution, benchmark_config, self.console_output)
+                    self.report_benchmark(solution, results)
+
+            if not self.console_output:
+                self.write_report()
+            if self.regressions:
+                self._notify(f"{len(self.regressions)} regression(s) against the baseline", CustomFormatter.red)
+                return 1
         else:
             print(bold("\n=== Advent of Code 2024 ==="))
+            if jobs > 1:
+                self.run_parallel(solutions, jobs, verbose=verbose)
+                return 0
             for solution_class in solutions:
                 solution = solution_class()
                 self.run_solution(solution, verbose)
+        return 0
 
 
 def parse_day_list(day_str: str) -> Set[int]:
@@ -244,6 +712,12 @@ def parse_day_list(day_str: str) -> Set[int]:
     return days
 
 
+def parse_profile_target(target: str) -> Tuple[int, List[int]]:
+    """Parse DAY or DAY:PART into the day and the parts to profile"""
+    day, _, part = target.partition(':')
+    return int(day), [int(part)] if part else [1, 2]
+
+
 def main(args=None):
     """
     Run the AOC solutions with the specified arguments.
@@ -254,21 +728,103 @@ def main(args=None):
         parser.add_argument("--days", type=str, help="Days to run (e.g., '1,3-5,7')")
         parser.add_argument("--skip", type=str, help="Days to skip (e.g., '2,6')")
         parser.add_argument("--benchmark", action="store_true", help="Run benchmark")
-        parser.add_argument("--benchmark-runs", type=int, default=10,
-                            help="Number of benchmark runs")
+        parser.add_argument("--benchmark-runs", type=int, default=BenchmarkConfig.max_runs,
+                            help="Maximum number of timed benchmark runs per part")
+        parser.add_argument("--min-runs", type=int, default=BenchmarkConfig.min_runs,
+                            help="Minimum number of timed benchmark runs per part")
+        parser.add_argument("--warmup", type=int, default=BenchmarkConfig.warmup_runs,
+                            help="Number of untimed warm-up runs per part")
+        parser.add_argument("--memory-runs", type=int, default=BenchmarkConfig.memory_runs,
+                            help="Number of separate runs measuring peak memory")
+        parser.add_argument("--target-error", type=float, default=BenchmarkConfig.target_error,
+                            help="Stop timing once the 95%% CI half width is within this fraction of the mean")
+        parser.add_argument("--max-time", type=float, default=BenchmarkConfig.max_time,
+                            help="Seconds of timed runs per part after which the target error is given up")
         parser.add_argument("--verbose", action="store_true", help="Verbose output")
+        parser.add_argument("--format", choices=report.FORMATS,
+                            help="Benchmark report format without ANSI codes (default: colored console output, "
+                                 "or text with --output); json and csv include every raw sample")
+        parser.add_argument("--output", type=str,
+                            help="Write the benchmark report to this file instead of stdout")
+        parser.add_argument("--no-history", action="store_true",
+                            help="Do not append benchmark results to the benchmark history")
+        parser.add_argument("--compare", action="store_true",
+                            help="Compare benchmark results against the history and exit non-zero on regressions")
+        parser.add_argument("--baseline", type=str,
+                            help="Commit to compare against (default: the most recent run on this machine)")
+        parser.add_argument("--profile", type=str, metavar="DAY[:PART]",
+                            help="Profile a day (or one of its parts) with cProfile and the sampling profiler")
+        parser.add_argument("--profile-top", type=int, default=20, help="Number of hottest functions to print")
+        parser.add_argument("--profile-dir", type=str, default=profiling.DEFAULT_PROFILE_DIR,
+                            help="Directory for .pstats and collapsed-stack (.folded) files")
+        parser.add_argument("--profile-interval", type=float, default=0.001,
+                            help="Sampling interval of the sampling profiler in seconds")
+        parser.add_argument("--no-input-cache", action="store_true",
+                            help="Re-read and re-parse the input on every run instead of caching it")
+        parser.add_argument("--timeout", type=float,
+                            help="Seconds a single run of a part may take before it is stopped as TIMEOUT")
+        parser.add_argument("--memory-limit", type=int, metavar="MB",
+                            help="Address space limit per part in MB, exceeding it is reported as OOM")
+        parser.add_argument("--scale", action="store_true",
+                            help="Run on generated inputs of growing size and fit the empirical complexity")
+        parser.add_argument("--scale-sizes", type=str,
+                            help="Comma-separated input sizes (default: the size ladder of each day)")
+        parser.add_argument("--scale-max-time", type=float, default=AocRunner.SLOW_THRESHOLD,
+                            help="Seconds of a single run after which larger sizes are skipped")
+        parser.add_argument("--seed", type=int, default=0, help="Seed of the generated inputs")
+        parser.add_argument("--workers", type=int, default=AocSolution.workers,
+                            help="Number of processes a solution may use for its own parallel search")
+        parser.add_argument("--jobs", type=int, default=1,
+                            help="Number of worker processes; each (day, part) pair runs as its own job")
         args = parser.parse_args()
 
     days = parse_day_list(getattr(args, 'days', None))
     skip_days = parse_day_list(getattr(args, 'skip', None))
 
+    if getattr(args, 'no_input_cache', False):
+        InputSource.cache_enabled = False
+    AocSolution.workers = getattr(args, 'workers', AocSolution.workers)
+
     runner = AocRunner()
-    runner.run(
+    if getattr(args, 'profile', None):
+        day, parts = parse_profile_target(args.profile)
+        return runner.profile(day, parts,
+                              output_dir=getattr(args, 'profile_dir', profiling.DEFAULT_PROFILE_DIR),
+                              top=getattr(args, 'profile_top', 20),
+                              interval=getattr(args, 'profile_interval', 0.001))
+
+    timeout, memory_limit = getattr(args, 'timeout', None), getattr(args, 'memory_limit', None)
+    if timeout is not None or memory_limit is not None:
+        runner.set_limits(timeout, memory_limit)
+
+    if getattr(args, 'scale', False):
+        scale_sizes = getattr(args, 'scale_sizes', None)
+        return runner.scale(days if days else None, skip_days if skip_days else None,
+                            sizes=[int(size) for size in scale_sizes.split(',')] if scale_sizes else None,
+                            seed=getattr(args, 'seed', 0),
+                            max_time=getattr(args, 'scale_max_time', AocRunner.SLOW_THRESHOLD))
+
+    runner.set_report(getattr(args, 'format', None), getattr(args, 'output', None))
+    no_history = getattr(args, 'no_history', False)
+    compare = getattr(args, 'compare', False)
+    if getattr(args, 'benchmark', False) and (compare or not no_history):
+        runner.track_history(BenchmarkHistory(), record=not no_history, compare=compare,
+                             baseline_commit=getattr(args, 'baseline', None))
+
+    return runner.run(
         days=days if days else None,
         skip_days=skip_days if skip_days else None,
         benchmark=getattr(args, 'benchmark', False),
-        benchmark_runs=getattr(args, 'benchmark_runs', 10),
-        verbose=getattr(args, 'verbose', True)
+        benchmark_config=BenchmarkConfig(
+            max_runs=getattr(args, 'benchmark_runs', BenchmarkConfig.max_runs),
+            min_runs=getattr(args, 'min_runs', BenchmarkConfig.min_runs),
+            warmup_runs=getattr(args, 'warmup', BenchmarkConfig.warmup_runs),
+            memory_runs=getattr(args, 'memory_runs', BenchmarkConfig.memory_runs),
+            target_error=getattr(args, 'target_error', BenchmarkConfig.target_error),
+            max_time=getattr(args, 'max_time', BenchmarkConfig.max_time)
+        ),
+        verbose=getattr(args, 'verbose', True),
+        jobs=getattr(args, 'jobs', 1)
     )
 
 
@@ -276,7 +832,7 @@ if __name__ == "__main__":
     # Example configurations for easy IDE running:
 
     # Run all days
-    main()
+    sys.exit(main())
 
     # Run specific days
     # main(type('Args', (), {'days': '1-5', 'skip': None, 'benchmark': True})())
@@ -286,3 +842,18 @@ if __name__ == "__main__":
 
     # Benchmark specific days
     # main(type('Args', (), {'days': '7', 'benchmark': True, 'benchmark_runs': 10})())
+
+    # Profile Day 6 Part 2
+    # main(type('Args', (), {'profile': '6:2', 'profile_top': 15})())
+
+    # Benchmark and compare against the last recorded run on this machine
+    # main(type('Args', (), {'days': '1-5', 'benchmark': True, 'compare': True})())
+
+    # Stop runs after 30 seconds or 2GB of memory
+    # main(type('Args', (), {'days': None, 'benchmark': True, 'timeout': 30, 'memory_limit': 2048})())
+
+    # Measure how Day 9 scales on generated inputs
+    # main(type('Args', (), {'days': '9', 'scale': True})())
+
+    # Run all days on 4 worker processes
+    # main(type('Args', (), {'days': None, 'skip': None, 'jobs': 4})())
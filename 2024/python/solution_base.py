@@ -1,17 +1,29 @@
 # aoc/solution_base.py
 import logging
+import mmap
 import os
 import shutil
 import sys
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
 from functools import wraps
-from typing import Any, Optional, List, Iterator, TypeVar
+from itertools import groupby
+from typing import Any, Optional, Iterator, Sequence, TypeVar
 
 from colorama import Style, init
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional and only used for array views of grids
+    np = None
+
+# Initialise colorama once: every init() call wraps stdout again, so calling it per InputSource nests the
+# wrappers until printing exceeds the recursion limit in long benchmarks
+init()
+
 
 class CustomFormatter(logging.Formatter):
     green = "\x1b[32;20m"
@@ -48,7 +60,8 @@ def bold(s: str) -> str:
 
 
 class ProgressStatus:
-    def __init__(self, total: int, desc: str = "Progress", show_count: bool = True, verbose: bool = True):
+    def __init__(self, total: int, desc: str = "Progress", show_count: bool = True, verbose: bool = True,
+                 refresh_interval: float = 0.1):
         """
         Initialize progress status bar
 
@@ -56,31 +69,42 @@ class ProgressStatus:
             total: Total number of items
             desc: Description to show before the progress
             show_count: Whether to show count (x/total) in addition to percentage
+            verbose: Whether to print the progress at all
+            refresh_interval: Minimum number of seconds between two redraws
         """
         self.total = total
         self.current = 0
         self.desc = desc
         self.show_count = show_count
         self.verbose = verbose
+        self.refresh_interval = refresh_interval
         self.terminal_width = shutil.get_terminal_size().columns
         self._last_len = 0
         self.extras = {}
+        self.start_time = time.perf_counter()
+        self._next_draw_time = self.start_time
 
     def update(self, step: int = 1, **kwargs) -> None:
         """
-        Update progress by step amount and optionally update extra values
+        Update progress by step amount and optionally update extra values.
+        The line is only redrawn once per refresh interval, so calling this in hot loops stays cheap.
 
         Args:
             step: Amount to increment progress
             **kwargs: Extra key-value pairs to display (e.g., loops_found=5)
         """
         self.current += step
-        self.extras.update(kwargs)
-        if self.verbose:
-            self._print_progress()
-
-    def _print_progress(self) -> None:
-        percentage = (self.current / self.total) * 100
+        if not self.verbose:
+            return
+        if kwargs:
+            self.extras.update(kwargs)
+        now = time.perf_counter()
+        if now >= self._next_draw_time:
+            self._next_draw_time = now + self.refresh_interval
+            self._print_progress(now)
+
+    def _print_progress(self, now: float) -> None:
+        percentage = (self.current / self.total) * 100 if self.total else 100
 
         # Build progress message
         msg_parts = [f"{self.desc}:"]
@@ -90,6 +114,13 @@ class ProgressStatus:
 
         msg_parts.append(f"({percentage:.1f}%)")
 
+        # Add throughput and estimated time remaining
+        elapsed = now - self.start_time
+        if elapsed > 0 and self.current > 0:
+            rate = self.current / elapsed
+            eta = max(self.total - self.current, 0) / rate
+            msg_parts.append(f"| {rate:.1f} it/s | ETA: {eta:.1f}s")
+
         # Add any extra information
         for key, value in self.extras.items():
             msg_parts.append(f"| {key}: {value}")
@@ -101,8 +132,9 @@ class ProgressStatus:
         sys.stdout.flush()
 
     def finish(self) -> None:
-        """Complete the progress and move to next line"""
+        """Draw the final state and move to next line"""
         if self.verbose:
+            self._print_progress(time.perf_counter())
             print(file=sys.stdout)
             sys.stdout.flush()
 
@@ -131,17 +163,169 @@ class Result:
     value: Any
     execution_time: float
     status: ResultStatus = ResultStatus.UNKNOWN
+    parse_time: float = 0
+    solve_part1_time: Optional[float] = None
+    solve_part2_time: Optional[float] = None
+
+    @property
+    def solve_time(self) -> float:
+        """Time spent in the solver itself, excluding reading and parsing the input"""
+        return self.execution_time - self.parse_time
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert lists into tuples so a cached value cannot be mutated by a solver"""
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def cached_reader(func):
+    """
+    Decorator for InputSource readers that caches the parsed result across InputSource instances.
+
+    Entries are keyed by input path, modification time, file size, reader name and arguments, so an edited
+    input file is never served stale. Results are frozen (lists become tuples) whether the cache is used or not,
+    so solvers see the same types either way, and cached values are returned as is.
+    The time spent inside readers is accumulated in InputSource.read_time, whether the cache is used or not.
+    """
+
+    @wraps(func)
+    def wrapper(self: 'InputSource', *args, **kwargs):
+        start_time = time.perf_counter()
+        self._read_depth += 1
+        try:
+            if not self.use_cache:
+                return _freeze(func(self, *args, **kwargs))
+
+            path = self._get_input_path()
+            stat = os.stat(path)
+            key = (path, stat.st_mtime_ns, stat.st_size, func.__name__, args, tuple(sorted(kwargs.items())))
+
+            cache = InputSource._cache
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+
+            value = _freeze(func(self, *args, **kwargs))
+            cache[key] = value
+            while len(cache) > InputSource.cache_size:
+                cache.popitem(last=False)
+            return value
+        finally:
+            self._read_depth -= 1
+            # Nested readers (e.g. read_integers -> read_lines) are only counted once
+            if self._read_depth == 0:
+                self.read_time += time.perf_counter() - start_time
+
+    return wrapper
+
+
+def streaming_reader(func):
+    """
+    Decorator for InputSource generators that accumulates the time spent producing items in
+    InputSource.read_time. Only the work between the solver's requests is counted (file I/O and conversion),
+    not the time the solver spends on an item before asking for the next one.
+    """
+
+    @wraps(func)
+    def wrapper(self: 'InputSource', *args, **kwargs):
+        return self._timed(func(self, *args, **kwargs))
+
+    return wrapper
+
+
+class GridBuffer:
+    """
+    Read-only 2D view over the raw bytes of a grid input.
+
+    The input file is memory-mapped, so no object is created per cell: (x, y) resolves to the byte at
+    y * stride + x, where stride is the row width plus the line terminator.
+    """
+
+    def __init__(self, buffer: mmap.mmap, width: int, height: int, stride: int):
+        self.buffer = buffer
+        self.data = memoryview(buffer)
+        self.width = width
+        self.height = height
+        self.stride = stride
+
+    def __getitem__(self, coord: tuple[int, int]) -> int:
+        x, y = coord
+        return self.data[y * self.stride + x]
+
+    def __enter__(self) -> 'GridBuffer':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def in_bounds(self, coord: tuple[int, int]) -> bool:
+        x, y = coord
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def index(self, x: int, y: int) -> int:
+        """Offset of the cell (x, y) in the underlying buffer"""
+        return y * self.stride + x
+
+    def coord(self, index: int) -> tuple[int, int]:
+        """Cell (x, y) of an offset in the underlying buffer"""
+        y, x = divmod(index, self.stride)
+        return x, y
+
+    def row(self, y: int) -> memoryview:
+        start = y * self.stride
+        return self.data[start:start + self.width]
+
+    def find(self, value: bytes, start: int = 0) -> Optional[tuple[int, int]]:
+        """Coordinate of the first occurrence of value at or after offset start, None if there is none"""
+        index = self.buffer.find(value, start)
+        return None if index == -1 else self.coord(index)
+
+    def find_all(self, value: bytes) -> Iterator[tuple[int, int]]:
+        index = self.buffer.find(value)
+        while index != -1:
+            yield self.coord(index)
+            index = self.buffer.find(value, index + 1)
+
+    def as_array(self) -> Optional['np.ndarray']:
+        """(height, width) uint8 array sharing memory with the file, or None if NumPy is not installed"""
+        if np is None:
+            return None
+        flat = np.frombuffer(self.buffer, dtype=np.uint8)
+        return np.lib.stride_tricks.as_strided(flat, shape=(self.height, self.width), strides=(self.stride, 1),
+                                               writeable=False)
+
+    def close(self) -> None:
+        self.data.release()
+        self.buffer.close()
 
 
 class InputSource:
-    def __init__(self, day: int, part: int, is_example: bool, example_suffix: str = None):
+    cache_enabled = True  # Global switch, e.g. to benchmark cold parsing
+    cache_size = 32  # Maximum number of parsed inputs kept (least recently used are evicted first)
+    _cache: OrderedDict = OrderedDict()
+
+    def __init__(self, day: int, part: int, is_example: bool, example_suffix: str = None,
+                 use_cache: Optional[bool] = None, path: Optional[str] = None):
         self.day = day
         self.part = part
         self.is_example = is_example
         self.example_suffix = example_suffix
-        init()
+        self.use_cache = InputSource.cache_enabled if use_cache is None else use_cache
+        self.path = path  # Explicit input file, e.g. a generated one, instead of the inputs/examples lookup
+        self.read_time = 0.0
+        self._read_depth = 0
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached inputs"""
+        InputSource._cache.clear()
 
     def _get_input_path(self) -> str:
+        if self.path is not None:
+            return self.path
+
         base_dir = os.path.dirname(os.path.dirname(__file__))
         file_prefix = "example" if self.is_example else "input"
         folder = file_prefix + 's'
@@ -165,49 +349,132 @@ class InputSource:
         # Fall back to common input
         return os.path.join(base_dir, folder, f"{file_prefix}_{self.day}.txt")
 
+    @cached_reader
     def read_raw(self) -> str:
         """Read the raw input file"""
         with open(self._get_input_path()) as f:
             return f.read().strip()
 
-    def read_lines(self, strip: bool = True) -> List[str]:
+    @cached_reader
+    def read_lines(self, strip: bool = True) -> Sequence[str]:
         """Read input as list of lines"""
         with open(self._get_input_path()) as f:
             if strip:
                 return [line.strip() for line in f.readlines()]
             return [line.rstrip('\n') for line in f.readlines()]
 
-    def read_lists_of_integers(self, seperator: str = None) -> List[List[int]]:
+    @cached_reader
+    def read_lists_of_integers(self, seperator: str = None) -> Sequence[Sequence[int]]:
         """Read input as list of lists of integers, split by seperator (default: None -> any whitespace)"""
         string_lists = [line.strip().split(seperator) for line in self.read_lines()]
         return [[int(num.strip()) for num in l] for l in string_lists]
 
-    def read_sections(self) -> List[str]:
+    @cached_reader
+    def read_sections(self) -> Sequence[str]:
         """Read input split by double newlines"""
         return self.read_raw().split('\n\n')
 
-    def read_integers(self) -> List[int]:
+    @cached_reader
+    def read_integers(self) -> Sequence[int]:
         """Read input as list of integers"""
         return [int(line) for line in self.read_lines()]
 
-    def read_digit_grid(self) -> List[List[int]]:
+    @cached_reader
+    def read_digit_grid(self) -> Sequence[Sequence[int]]:
         """Read input as 2D grid of single digits"""
         return [[int(d) for d in line] for line in self.read_lines()]
 
-    def read_char_grid(self) -> List[List[str]]:
+    @cached_reader
+    def read_char_grid(self) -> Sequence[Sequence[str]]:
         """Read input as 2D character grid"""
         return [list(line) for line in self.read_lines()]
 
-    def read_sections_of_lines(self) -> List[List[str]]:
+    @cached_reader
+    def read_sections_of_lines(self) -> Sequence[Sequence[str]]:
         """Read input as sections of lines, split by double newlines"""
         return [section.split('\n') for section in self.read_sections()]
 
+    def read_grid_buffer(self) -> GridBuffer:
+        """Memory-map the input as a 2D grid of bytes (zero-copy, O(1) cell access)"""
+        start_time = time.perf_counter()
+        with open(self._get_input_path(), 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError("Cannot read a grid from an empty input")
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        newline = buffer.find(b'\n')
+        if newline == -1:
+            width = stride = len(buffer)
+        else:
+            width = newline - 1 if newline > 0 and buffer[newline - 1] == ord('\r') else newline
+            stride = newline + 1
+
+        end = len(buffer)
+        while end > 0 and buffer[end - 1] in b'\r\n':
+            end -= 1
+        height = (end + stride - width) // stride
+
+        if self._read_depth == 0:
+            self.read_time += time.perf_counter() - start_time
+        return GridBuffer(buffer, width, height, stride)
+
+    def _timed(self, items: Iterator) -> Iterator:
+        """Yield from items, adding the time spent in each step of the underlying iterator to read_time"""
+        perf_counter = time.perf_counter
+        while True:
+            start_time = perf_counter()
+            try:
+                item = next(items)
+            except StopIteration:
+                self.read_time += perf_counter() - start_time
+                return
+            self.read_time += perf_counter() - start_time
+            yield item
+
+    @streaming_reader
     def read_as_iterator(self) -> Iterator[str]:
         """Read input as an iterator of lines (memory efficient for large inputs)"""
         with open(self._get_input_path()) as f:
             for line in f:
                 yield line.strip()
 
+    @streaming_reader
+    def iter_sections(self) -> Iterator[Iterator[str]]:
+        """
+        Stream the input as sections split by blank lines, each section being an iterator of stripped lines.
+        Only one line is held in memory at a time; a section is skipped over if the next one is requested first.
+        """
+        with open(self._get_input_path()) as f:
+            for is_content, lines in groupby((line.strip() for line in f), key=bool):
+                if is_content:
+                    # The lines of a section are pulled by the solver, outside of the outer generator
+                    yield self._timed(lines)
+
+    @streaming_reader
+    def iter_int_rows(self, seperator: str = None) -> Iterator[list[int]]:
+        """Stream input as lists of integers per line, split by seperator (default: None -> any whitespace)"""
+        with open(self._get_input_path()) as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield [int(num) for num in line.split(seperator)]
+
+    @streaming_reader
+    def iter_chunks(self, chunk_size: int = 1 << 20) -> Iterator[str]:
+        """Stream the raw input in chunks of chunk_size characters, lines may be split between chunks"""
+        with open(self._get_input_path()) as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
+    @streaming_reader
+    def iter_ints(self) -> Iterator[int]:
+        """Stream input as one integer per line"""
+        with open(self._get_input_path()) as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield int(line)
+
 
 def solution(expected_result: Any = None):
     """Decorator to annotate solutions with expected results"""
@@ -233,6 +500,8 @@ def _print_verbose(message: str, verbose: bool) -> None:
 
 
 class AocSolution(ABC):
+    workers = 1  # Number of processes a solution may use for its own parallel search
+
     @property
     def day(self) -> int:
         """Extract day number from class name (Day1 -> 1)"""
@@ -255,29 +524,53 @@ class AocSolution(ABC):
 
     def __init__(self):
         self.logger = logging.getLogger(f"AOC_Day_{self.day}")
-        self.logger.addHandler(CustomFormatter.get_console_handler())
+        if not self.logger.handlers:
+            self.logger.addHandler(CustomFormatter.get_console_handler())
         self.progress_verbose = True
 
-    @staticmethod
-    def _time_execution(func, *args, **kwargs) -> Result:
+    def parse(self, input_source: InputSource) -> Any:
+        """
+        Optional hook to parse the input, shared by both parts.
+        Whatever it returns is passed to solve_part1/solve_part2; by default that is the InputSource itself.
+        """
+        return input_source
+
+    def _time_execution(self, part: int, input_source: InputSource) -> Result:
+        solver = self.solve_part1 if part == 1 else self.solve_part2
+
         start_time = time.perf_counter()
-        result = func(*args, **kwargs)
+        parsed = self.parse(input_source)
+        parse_end_time = time.perf_counter()
+        parse_read_time = input_source.read_time
+
+        result = solver(parsed)
         if not isinstance(result, Result):
             result = Result(result, 0, ResultStatus.UNKNOWN)
         end_time = time.perf_counter()
+
+        # Input read by the solver itself (no parse hook) still counts as parsing
+        solver_read_time = input_source.read_time - parse_read_time
         result.execution_time = end_time - start_time
+        result.parse_time = parse_end_time - start_time + solver_read_time
+        setattr(result, f"solve_part{part}_time", end_time - parse_end_time - solver_read_time)
         return result
 
+    def solve(self, part: int, is_example: bool = False, example_suffix: str = None,
+              input_path: Optional[str] = None) -> Result:
+        """Solve a single part and return its timed result without printing anything"""
+        input_source = InputSource(self.day, part, is_example, example_suffix, path=input_path)
+        return self._time_execution(part, input_source)
+
+    @staticmethod
+    def format_result(result: Result, is_example: bool = False) -> str:
+        time_str = f"{result.execution_time * 1000:.2f} ms" if result.execution_time < 1 else f"{result.execution_time:.2f} s"
+        return status_color(f"[{'-' if is_example else result.status.value}] {bold(result.value)} ({time_str})",
+                            result.status, is_example)
+
     def execute_part(self, part: int, is_example: bool, example_suffix: str = None, verbose: bool = True,
                      log_prefix: str = '') -> None:
-        input_source = InputSource(self.day, part, is_example, example_suffix)
-        solver = self.solve_part1 if part == 1 else self.solve_part2
-        result = self._time_execution(solver, input_source)
-        time_str = f"{result.execution_time * 1000:.2f} ms" if result.execution_time < 1 else f"{result.execution_time:.2f} s"
-        _print_verbose(log_prefix +
-                       status_color(f"[{'-' if is_example else result.status.value}] {bold(result.value)} ({time_str})",
-                                    result.status, is_example),
-                       verbose)
+        result = self.solve(part, is_example, example_suffix)
+        _print_verbose(log_prefix + self.format_result(result, is_example), verbose)
 
     def _set_logging_level(self, debug: bool, verbose: bool) -> None:
         if debug:
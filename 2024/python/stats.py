@@ -0,0 +1,91 @@
+import math
+import statistics
+from typing import Sequence, Tuple
+
+# Two-sided 95% critical values of Student's t distribution by degrees of freedom
+_T_CRITICAL_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306, 9: 2.262, 10: 2.228,
+    11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145, 15: 2.131, 16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086,
+    21: 2.080, 22: 2.074, 23: 2.069, 24: 2.064, 25: 2.060, 26: 2.056, 27: 2.052, 28: 2.048, 29: 2.045, 30: 2.042,
+    40: 2.021, 60: 2.000, 120: 1.980,
+}
+_Z_95 = 1.960
+
+
+def t_critical(df: float) -> float:
+    """Two-sided 95% critical value of Student's t, rounded down to the nearest tabulated degree of freedom"""
+    if df < 1:
+        return math.inf
+    if df > 120:
+        return _Z_95
+    return _T_CRITICAL_95[max(key for key in _T_CRITICAL_95 if key <= df)]
+
+
+def mean(samples: Sequence[float]) -> float:
+    return statistics.fmean(samples) if samples else 0
+
+
+def median(samples: Sequence[float]) -> float:
+    return statistics.median(samples) if samples else 0
+
+
+def stddev(samples: Sequence[float]) -> float:
+    """Sample standard deviation, 0 for fewer than two samples"""
+    return statistics.stdev(samples) if len(samples) > 1 else 0
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """q-th percentile (0..100) with linear interpolation between the closest ranks"""
+    if not samples:
+        return 0
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * q / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def ci_half_width(samples: Sequence[float]) -> float:
+    """Half width of the 95% confidence interval of the mean, infinite for fewer than two samples"""
+    if len(samples) < 2:
+        return math.inf
+    return t_critical(len(samples) - 1) * stddev(samples) / math.sqrt(len(samples))
+
+
+def confidence_interval(samples: Sequence[float]) -> Tuple[float, float]:
+    """95% confidence interval of the mean"""
+    center = mean(samples)
+    half_width = ci_half_width(samples)
+    return center - half_width, center + half_width
+
+
+def relative_error(samples: Sequence[float]) -> float:
+    """Half width of the 95% confidence interval relative to the mean"""
+    center = mean(samples)
+    return ci_half_width(samples) / center if center else math.inf
+
+
+def welch_t_test(a: Sequence[float], b: Sequence[float]) -> Tuple[float, float]:
+    """Welch's t statistic for mean(a) > mean(b) and its Welch-Satterthwaite degrees of freedom"""
+    if len(a) < 2 or len(b) < 2:
+        return 0, 0
+    var_a = statistics.variance(a) / len(a)
+    var_b = statistics.variance(b) / len(b)
+    if var_a + var_b == 0:
+        return (math.inf if mean(a) > mean(b) else 0), math.inf
+    t = (mean(a) - mean(b)) / math.sqrt(var_a + var_b)
+    df = (var_a + var_b) ** 2 / (var_a ** 2 / (len(a) - 1) + var_b ** 2 / (len(b) - 1))
+    return t, df
+
+
+def is_significantly_greater(a: Sequence[float], b: Sequence[float]) -> bool:
+    """Whether the mean of a is greater than the mean of b by a one-sided Welch t-test at the 97.5% level"""
+    t, df = welch_t_test(a, b)
+    return df > 0 and t > t_critical(df)
+
+
+def fit_power_law(sizes: Sequence[float], times: Sequence[float]) -> Tuple[float, float]:
+    """Least-squares fit of times = c * sizes^k in log-log space, returns the exponent k and the factor c"""
+    slope, intercept = statistics.linear_regression([math.log(size) for size in sizes],
+                                                    [math.log(time) for time in times])
+    return slope, math.exp(intercept)